@@ -427,6 +427,18 @@ class Message:
 
 
 class Player:
+    # Slots for the faction/streak fields read on every trade and combat tick;
+    # __dict__ stays so save data can still attach its other attributes.
+    __slots__ = (
+        "authority_standing",
+        "frontier_standing",
+        "sector_reputation",
+        "combat_win_streak",
+        "contract_chain_streak",
+        "barred_planets",
+        "__dict__",
+    )
+
     def __init__(self, name, spaceship, credits=200):
         self.name = name
         self.spaceship = spaceship
@@ -444,6 +456,11 @@ class Player:
         self.combat_win_streak = 0
         self.combat_lifetime_wins = 0
         self.last_special_weapon_time = 0.0
+        # Faction standings; sector_reputation mirrors authority for old saves.
+        self.authority_standing = 0
+        self.sector_reputation = 0
+        self.frontier_standing = 0
+        self.contract_chain_streak = 0
 
     def add_message(self, message):
         """Adds a message to the mailbox, respecting the 20-message limit for non-saved mail."""
@@ -196,7 +196,7 @@ class CombatMixin:
             target_authority = int(
                 raw.get("authority_standing", raw.get("sector_reputation", 0)) or 0
             )
-            contraband_names = set(self.get_smuggling_item_names())
+            contraband_names = self._smuggling_item_name_set()
             target_contraband_units = int(
                 sum(
                     max(0, int(qty or 0))
@@ -1,10 +1,12 @@
 import time
 import os
 import random
+import sys
 from pathlib import Path
 from sqlite_store import SQLiteStore
 from classes import load_spaceships
 from planets import generate_planets
+from .economy import EconomyConfig
 
 
 class CoreMixin:
@@ -83,6 +85,10 @@ class CoreMixin:
             if key not in self.config:
                 self.config[key] = value
 
+        # Defaults are resolved once here rather than on every trade.
+        self.cfg = EconomyConfig.from_config(self.config)
+        self._invalidate_contraband_caches()
+
     def __init__(self):
         server_root = Path(__file__).resolve().parents[1]
         self.save_dir = str(server_root / "saves")
@@ -99,6 +105,7 @@ class CoreMixin:
         self.load_global_config()
         self.planets = generate_planets()
         self._rebuild_planet_registry()
+        self._item_to_planets = None
         # Apply global bank switch
         enable_bank = self.config.get("enable_bank", True)
         for planet in self.planets:
@@ -112,6 +119,7 @@ class CoreMixin:
             "Standard Fuel Cell": "Fuel Cells",
             "Fuel Cell": "Fuel Cells",
         }
+        self._canonical_item_cache = {}
         self.planet_price_penalty_duration = 86400
         self.planet_price_penalty_multiplier = float(
             self.config["planet_price_penalty_multiplier"]
@@ -125,6 +133,7 @@ class CoreMixin:
         self.current_port_spotlight = None
         self.planet_heat = {}
         self.last_heat_decay_time = time.time()
+        self._next_heat_decay_at = None
         self.planet_events = {}
         self.market_momentum = {}
         self.market_trade_volume = {}
@@ -154,8 +163,10 @@ class CoreMixin:
         self.bribed_planets = set()
         self.bribe_registry = {}
         self._smuggling_item_cache = None
+        self._smuggling_item_set = None
         self._smuggling_item_meta_cache = {}
         self._contraband_profile_cache = {}
+        self._request_scope = None
 
         # NPC Ships
         self.npc_ships = self._init_npc_ships()
@@ -166,6 +177,7 @@ class CoreMixin:
     def _rebuild_planet_registry(self):
         self.planet_by_id = {}
         self.planet_id_by_name = {}
+        self.planet_by_name = {}
         seen_ids = set()
 
         for idx, planet in enumerate(list(self.planets or []), start=1):
@@ -184,6 +196,7 @@ class CoreMixin:
             self.planet_id_by_name[str(getattr(planet, "name", "")).strip().lower()] = int(
                 planet_id
             )
+            self.planet_by_name.setdefault(getattr(planet, "name", None), planet)
 
     def normalize_planet_id(self, planet_id):
         try:
@@ -212,6 +225,13 @@ class CoreMixin:
             return None
         return self.get_planet_by_id(planet_id)
 
+    def _planet_named(self, planet_name):
+        """Exact-name planet lookup backed by the registry built at load time."""
+        registry = getattr(self, "planet_by_name", None)
+        if registry is None:
+            return next((p for p in self.planets if p.name == planet_name), None)
+        return registry.get(planet_name)
+
     def get_current_planet_id(self):
         if not getattr(self, "current_planet", None):
             return None
@@ -308,7 +328,20 @@ class CoreMixin:
         return npcs
 
     def _canonical_item_name(self, item_name):
-        return self.item_aliases.get(item_name, item_name)
+        cache = getattr(self, "_canonical_item_cache", None)
+        if cache is None:
+            cache = self._canonical_item_cache = {}
+        name = cache.get(item_name)
+        if name is not None:
+            return name
+
+        name = self.item_aliases.get(item_name, item_name)
+        if isinstance(name, str):
+            name = sys.intern(name)
+            # Names arrive from clients; cap the cache so junk can't grow it.
+            if len(cache) < 1024:
+                cache[item_name] = name
+        return name
 
     def _normalize_player_inventory(self):
         if not self.player or not isinstance(self.player.inventory, dict):
@@ -331,6 +364,10 @@ class CoreMixin:
         """Checks if the player is currently barred from a planet."""
         if not self.player:
             return False, ""
+        barred = self.player.barred_planets
+        if not barred:
+            # Common case: no active bans, so skip planet resolution entirely.
+            return False, ""
 
         keys_to_check = [str(planet_name)]
         resolved_planet = self.get_planet_by_id(planet_name) or self.get_planet_by_name(
@@ -340,17 +377,18 @@ class CoreMixin:
             keys_to_check.append(str(getattr(resolved_planet, "planet_id", "")))
             keys_to_check.append(str(getattr(resolved_planet, "name", "")))
 
-        for key in [k for k in keys_to_check if str(k).strip()]:
-            if key not in self.player.barred_planets:
+        now = time.time()
+        for key in keys_to_check:
+            if key not in barred or not key.strip():
                 continue
-            expiry = float(self.player.barred_planets.get(key, 0.0) or 0.0)
-            if time.time() < expiry:
-                rem = (expiry - time.time()) / 3600
+            expiry = float(barred.get(key, 0.0) or 0.0)
+            if now < expiry:
+                rem = (expiry - now) / 3600
                 return (
                     True,
                     f"You are barred from this quadrant for another {rem:.1f} hours.",
                 )
-            del self.player.barred_planets[key]
+            del barred[key]
         return False, ""
 
     def get_smuggling_item_names(self):
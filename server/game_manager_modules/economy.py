@@ -1,10 +1,189 @@
+import heapq
 import math
 import time
 import random
+from random import choice as _choice, randint as _randint, random as _random
+from contextlib import contextmanager
+from dataclasses import dataclass
+from operator import itemgetter
 from planets import base_prices, active_item_names
 from sqlite_store import read_default_catalog_text
 
 
+@dataclass(slots=True, frozen=True)
+class EconomyConfig:
+    """Typed, pre-clamped economy tunables read on the trade hot path."""
+
+    law_heat_gain_trade: int
+    law_heat_gain_detected: int
+    law_heat_detected_ship_level_step: float
+    law_heat_penalty_step: float
+    law_heat_decay_per_hour: int
+    contract_chain_bonus_per_completion: float
+    contract_chain_bonus_cap: float
+    contraband_price_tier_step: float
+    bribe_smuggling_sell_bonus_per_level: float
+    bribe_smuggling_discount_per_level: float
+    frontier_smuggling_discount_step: float
+    smuggle_nonhub_sell_penalty: float
+    reputation_contraband_trade_penalty: int
+    frontier_contraband_trade_bonus: int
+    # Travel fuel multiplier with the global -10% balance adjustment applied.
+    fuel_usage_multiplier: float
+    # Market rotation period, gated on every price read.
+    market_rotation_interval_seconds: float
+    # Docking fee inputs for get_docking_fee.
+    docking_base_fee: float
+    docking_level_multiplier: float
+    docking_reputation_step: float
+    docking_authority_negative_step: float
+    docking_authority_negative_cap: float
+    docking_authority_positive_step: float
+    docking_authority_positive_cap: float
+    # Detected-scan heat per ship level (index = level), built once per load.
+    detected_heat_by_level: tuple
+
+    def detected_heat(self, ship_level):
+        table = self.detected_heat_by_level
+        if ship_level < len(table):
+            return table[ship_level]
+        return _compute_detected_heat(
+            self.law_heat_gain_detected,
+            ship_level,
+            self.law_heat_detected_ship_level_step,
+        )
+
+    @classmethod
+    def from_config(cls, config):
+        get = config.get
+        heat_detected = int(get("law_heat_gain_detected", 8))
+        heat_ship_step = max(0.0, float(get("law_heat_detected_ship_level_step", 0.18)))
+        try:
+            fuel_mult = float(get("fuel_usage_multiplier", 1.15))
+        except Exception:
+            fuel_mult = 1.15
+        return cls(
+            law_heat_gain_trade=int(get("law_heat_gain_trade", 2)),
+            law_heat_gain_detected=heat_detected,
+            law_heat_detected_ship_level_step=heat_ship_step,
+            law_heat_penalty_step=float(get("law_heat_penalty_step", 0.20)),
+            law_heat_decay_per_hour=max(0, int(get("law_heat_decay_per_hour", 3))),
+            contract_chain_bonus_per_completion=float(
+                get("contract_chain_bonus_per_completion")
+            ),
+            contract_chain_bonus_cap=float(get("contract_chain_bonus_cap")),
+            contraband_price_tier_step=float(get("contraband_price_tier_step")),
+            bribe_smuggling_sell_bonus_per_level=float(
+                get("bribe_smuggling_sell_bonus_per_level")
+            ),
+            bribe_smuggling_discount_per_level=float(
+                get("bribe_smuggling_discount_per_level")
+            ),
+            frontier_smuggling_discount_step=float(
+                get("frontier_smuggling_discount_step", 0.005)
+            ),
+            smuggle_nonhub_sell_penalty=max(
+                0.35, float(get("smuggle_nonhub_sell_penalty"))
+            ),
+            reputation_contraband_trade_penalty=abs(
+                int(get("reputation_contraband_trade_penalty"))
+            ),
+            frontier_contraband_trade_bonus=abs(
+                int(get("frontier_contraband_trade_bonus", 1))
+            ),
+            fuel_usage_multiplier=max(0.0, fuel_mult * 0.90),
+            market_rotation_interval_seconds=float(
+                max(1, int(get("market_update_interval_minutes", 20))) * 60
+            ),
+            docking_base_fee=float(get("base_docking_fee")),
+            docking_level_multiplier=float(get("docking_fee_ship_level_multiplier")),
+            docking_reputation_step=float(get("reputation_docking_fee_step")),
+            docking_authority_negative_step=max(
+                0.0, float(get("authority_negative_docking_step", 0.010))
+            ),
+            docking_authority_negative_cap=max(
+                0.0, float(get("authority_negative_docking_cap", 0.35))
+            ),
+            docking_authority_positive_step=max(
+                0.0, float(get("authority_positive_docking_discount_step", 0.004))
+            ),
+            docking_authority_positive_cap=max(
+                0.0, float(get("authority_positive_docking_discount_cap", 0.20))
+            ),
+            detected_heat_by_level=tuple(
+                _compute_detected_heat(heat_detected, level, heat_ship_step)
+                for level in range(64)
+            ),
+        )
+
+
+# Planet event table shared by every roll; each event copies its template.
+_PLANET_EVENT_TEMPLATES = (
+    {
+        "type": "FESTIVAL",
+        "label": "Festival Surge",
+        "desc": "Crowds and celebration spike commodity flow.",
+        "buy_mult": 0.92,
+        "docking_mult": 1.08,
+        "contract_mult": 1.10,
+    },
+    {
+        "type": "EMBARGO",
+        "label": "Trade Embargo",
+        "desc": "Restrictions tighten supply and docking access.",
+        "buy_mult": 1.24,
+        "docking_mult": 1.28,
+        "contract_mult": 1.24,
+    },
+    {
+        "type": "SHORTAGE",
+        "label": "Critical Shortage",
+        "desc": "Essential goods are scarce and margins jump.",
+        "buy_mult": 1.18,
+        "docking_mult": 1.06,
+        "contract_mult": 1.16,
+    },
+    {
+        "type": "STRIKE",
+        "label": "Dockworkers Strike",
+        "desc": "Port throughput drops and schedules destabilize.",
+        "buy_mult": 1.12,
+        "docking_mult": 0.94,
+        "contract_mult": 1.08,
+    },
+)
+
+
+_DEFAULT_CONTRABAND_PROFILE = {
+    "tier": "LOW",
+    "tier_rank": 1,
+    "price_mult": 1.10,
+    "detection_mult": 0.95,
+    "heat_mult": 0.90,
+}
+
+
+def _clamp(value, lo, hi):
+    """Bound value to [lo, hi] with one comparison chain instead of min/max."""
+    return lo if value < lo else hi if value > hi else value
+
+
+def _compute_detected_heat(base_heat, ship_level, step):
+    """Heat added when a scan catches contraband; bigger ships draw more."""
+    return max(1, int(round(base_heat * (1.0 + ((ship_level - 1) * step)))))
+
+
+def _contraband_sell_multiplier(
+    tier_rank, tier_step, item_base_price, bribe_level, bribe_sell_bonus
+):
+    """Scalar contraband sell multiplier; plain numbers in, float out."""
+    mult = 1.0 + ((tier_rank - 1) * tier_step * 0.55)
+    value_ratio = _clamp(item_base_price / 4000.0, 0.0, 2.0)
+    mult *= 1.0 + (value_ratio * 0.10)
+    mult *= 1.0 + (max(0, bribe_level) * bribe_sell_bonus)
+    return mult
+
+
 class EconomyMixin:
     RESOURCE_TYPES = ("fuel", "ore", "tech", "bio", "rare")
 
@@ -121,7 +300,7 @@ class EconomyMixin:
 
         fuel_amount = int(resources.get("fuel", defaults["fuel"]))
         try:
-            ship.fuel = float(max(0, min(capacities["fuel"], fuel_amount)))
+            ship.fuel = float(_clamp(fuel_amount, 0, capacities["fuel"]))
         except Exception:
             pass
 
@@ -146,7 +325,7 @@ class EconomyMixin:
             if affected and affected != str(resource_type).strip().lower():
                 continue
             mult *= float(evt.get("multiplier", 1.0) or 1.0)
-        return max(0.10, min(5.0, float(mult)))
+        return _clamp(float(mult), 0.10, 5.0)
 
     def _maybe_roll_economy_event(self):
         if getattr(self, "store", None) is None:
@@ -155,8 +334,8 @@ class EconomyMixin:
         if active:
             return None
 
-        chance = max(0.0, min(0.40, float(self.config.get("economy_event_chance", 0.06))))
-        if random.random() > chance:
+        chance = _clamp(float(self.config.get("economy_event_chance", 0.06)), 0.0, 0.40)
+        if _random() > chance:
             return None
 
         templates = [
@@ -164,25 +343,25 @@ class EconomyMixin:
                 "event_type": "FUEL_SHORTAGE",
                 "affected_resource": "fuel",
                 "multiplier": 1.85,
-                "hours": random.randint(2, 5),
+                "hours": _randint(2, 5),
                 "message": "GALAXY EVENT: FUEL SHORTAGE. FUEL PRICES SPIKED.",
             },
             {
                 "event_type": "MINING_BOOM",
                 "affected_resource": "ore",
                 "multiplier": 0.78,
-                "hours": random.randint(2, 5),
+                "hours": _randint(2, 5),
                 "message": "GALAXY EVENT: MINING BOOM. ORE MARKET COOLED.",
             },
             {
                 "event_type": "TECH_RUSH",
                 "affected_resource": "tech",
                 "multiplier": 1.30,
-                "hours": random.randint(2, 6),
+                "hours": _randint(2, 6),
                 "message": "GALAXY EVENT: TECH RUSH. HIGH-DEMAND TECH SPIKE.",
             },
         ]
-        pick = random.choice(templates)
+        pick = _choice(templates)
         now = float(time.time())
         end_ts = now + (int(pick["hours"]) * 3600.0)
         self.store.add_economy_event(
@@ -223,7 +402,7 @@ class EconomyMixin:
         maintenance_ore = 0
         maintenance_bio = 0
         rebellions = []
-        owned = set(str(k) for k in dict(getattr(self.player, "owned_planets", {}) or {}).keys())
+        owned = {str(k) for k in (getattr(self.player, "owned_planets", None) or {})}
         now = float(time.time())
 
         for planet_id, bucket in production_rows.items():
@@ -276,7 +455,7 @@ class EconomyMixin:
                 deficit = max(0, ore_need - ore_paid) + max(0, bio_need - bio_paid)
                 if deficit > 0:
                     risk = min(0.55, 0.10 + (deficit * 0.03))
-                    if random.random() < risk:
+                    if _random() < risk:
                         planet = self.get_planet_by_id(planet_id)
                         if planet and str(getattr(planet, "owner", "") or "").strip().lower() == str(self.player.name).strip().lower():
                             planet.owner = None
@@ -319,7 +498,7 @@ class EconomyMixin:
         if cycles <= 0:
             return False, ""
 
-        rate = max(0.0, min(0.03, float(self.config.get("resource_interest_rate", 0.01))))
+        rate = _clamp(float(self.config.get("resource_interest_rate", 0.01)), 0.0, 0.03)
         resources = self.store.get_player_resources(player_id)
         gains = {}
         for r_type in ("ore", "tech", "bio", "rare"):
@@ -492,18 +671,25 @@ class EconomyMixin:
             f"RECEIVED {r_qty} {r_type.upper()}."
         )
 
+    def _get_fluctuating_planets(self):
+        """Planets that rotate their prices, rebuilt when the roster changes."""
+        planets = getattr(self, "planets", None) or []
+        cached = getattr(self, "_fluctuating_planets_cache", None)
+        if cached is not None and cached[0] is planets and cached[1] == len(planets):
+            return cached[2]
+        fluctuating = tuple(p for p in planets if hasattr(p, "fluctuate_prices"))
+        self._fluctuating_planets_cache = (planets, len(planets), fluctuating)
+        return fluctuating
+
     def _apply_market_rotation_if_due(self):
-        interval_minutes = max(1, int(self.config.get("market_update_interval_minutes", 20)))
-        interval_seconds = float(interval_minutes * 60)
+        interval_seconds = self._economy_cfg().market_rotation_interval_seconds
         now = time.time()
         last_ts = float(getattr(self, "last_market_rotation_time", 0.0) or 0.0)
 
         if last_ts > 0 and (now - last_ts) < interval_seconds:
             return
 
-        for planet in list(getattr(self, "planets", []) or []):
-            if not hasattr(planet, "fluctuate_prices"):
-                continue
+        for planet in self._get_fluctuating_planets():
             try:
                 planet.fluctuate_prices()
             except Exception:
@@ -529,6 +715,23 @@ class EconomyMixin:
         self._maybe_roll_economy_event()
 
         self.last_market_rotation_time = now
+        self._item_to_planets = None
+
+    def _rebuild_item_index(self):
+        """Map item -> [(planet, base_price)] for every planet that lists it."""
+        index = {}
+        for planet in self.planets:
+            for item_name, base_price in planet.items.items():
+                index.setdefault(item_name, []).append((planet, base_price))
+        self._item_to_planets = index
+        return index
+
+    def _get_item_index(self):
+        # Base prices only move on market rotation, which drops the index.
+        index = getattr(self, "_item_to_planets", None)
+        if index is None:
+            index = self._rebuild_item_index()
+        return index
 
     def _planet_state_key(self, planet_ref=None):
         if planet_ref is None:
@@ -544,8 +747,9 @@ class EconomyMixin:
             return str(normalized)
         return ""
 
-    def _refresh_bribe_registry(self):
-        now = time.time()
+    def _refresh_bribe_registry(self, now=None):
+        if now is None:
+            now = time.time()
         active = {}
         for planet_key, state in (self.bribe_registry or {}).items():
             if not isinstance(state, dict):
@@ -567,16 +771,51 @@ class EconomyMixin:
         self.bribe_registry = active
         self.bribed_planets = set(active.keys())
 
+    def _economy_cfg(self):
+        cfg = getattr(self, "cfg", None)
+        if cfg is None:
+            cfg = self.cfg = EconomyConfig.from_config(self.config)
+        return cfg
+
+    @contextmanager
+    def _economy_request(self):
+        """Memoize bribe/heat/price reads for one read-only top-level API call.
+
+        Nested entries reuse the outer scope; the memo is dropped when the
+        outermost call returns so later mutations are always observed.
+        """
+        scope = getattr(self, "_request_scope", None)
+        if scope is not None:
+            yield scope
+            return
+        self._request_scope = {}
+        try:
+            yield self._request_scope
+        finally:
+            self._request_scope = None
+
     def _get_bribe_level(self, planet_name=None):
+        scope = getattr(self, "_request_scope", None)
+        if scope is not None:
+            cached = scope.get(("bribe", planet_name))
+            if cached is not None:
+                return cached
+
         self._refresh_bribe_registry()
         p_key = self._planet_state_key(planet_name)
         if not p_key:
-            return 0
-        state = self.bribe_registry.get(str(p_key), {})
-        return max(0, int(state.get("level", 0)))
-
-    def _get_bribe_time_remaining_seconds(self, planet_name=None):
-        self._refresh_bribe_registry()
+            level = 0
+        else:
+            state = self.bribe_registry.get(str(p_key), {})
+            level = max(0, int(state.get("level", 0)))
+        if scope is not None:
+            scope[("bribe", planet_name)] = level
+        return level
+
+    def _get_bribe_time_remaining_seconds(self, planet_name=None, now=None):
+        if now is None:
+            now = time.time()
+        self._refresh_bribe_registry(now)
         p_key = self._planet_state_key(planet_name)
         if not p_key:
             return 0
@@ -584,7 +823,7 @@ class EconomyMixin:
         expires_at = float(state.get("expires_at", 0.0))
         if expires_at <= 0:
             return 0
-        return max(0, int(expires_at - time.time()))
+        return max(0, int(expires_at - now))
 
     def _get_bribe_quote(self, planet=None):
         target = planet or self.current_planet
@@ -657,6 +896,10 @@ class EconomyMixin:
         }
 
     def get_bribe_market_snapshot(self, planet_name=None):
+        with self._economy_request():
+            return self._bribe_market_snapshot(planet_name)
+
+    def _bribe_market_snapshot(self, planet_name=None):
         target = self.get_planet_by_id(planet_name) or self.get_planet_by_name(
             planet_name
         )
@@ -695,6 +938,7 @@ class EconomyMixin:
 
         if rows is None:
             self._smuggling_item_cache = []
+            self._smuggling_item_set = frozenset()
             self._smuggling_item_meta_cache = metadata
             return
 
@@ -720,7 +964,7 @@ class EconomyMixin:
             required_bribe_level = None
             if len(parts) >= 3 and parts[2]:
                 try:
-                    required_bribe_level = max(0, min(3, int(parts[2])))
+                    required_bribe_level = _clamp(int(parts[2]), 0, 3)
                 except ValueError:
                     required_bribe_level = None
 
@@ -730,8 +974,25 @@ class EconomyMixin:
             }
 
         self._smuggling_item_cache = item_names
+        self._smuggling_item_set = frozenset(item_names)
         self._smuggling_item_meta_cache = metadata
 
+    def _invalidate_contraband_caches(self):
+        """Drop catalog and profile caches so the next lookup rebuilds them."""
+        self._smuggling_item_cache = None
+        self._smuggling_item_set = None
+        self._smuggling_item_meta_cache = {}
+        self._contraband_profile_cache = {}
+
+    def _smuggling_item_name_set(self):
+        """Frozen view of the contraband catalog for membership checks."""
+        self._load_smuggling_item_cache()
+        names = getattr(self, "_smuggling_item_set", None)
+        if names is None:
+            names = frozenset(self._smuggling_item_cache or ())
+            self._smuggling_item_set = names
+        return names
+
     def _get_smuggling_item_metadata(self, item_name):
         self._load_smuggling_item_cache()
         item = str(item_name or "").strip()
@@ -740,7 +1001,7 @@ class EconomyMixin:
                 "base_price": 500,
                 "required_bribe_level": 0,
             }
-        data = dict((self._smuggling_item_meta_cache or {}).get(item, {}) or {})
+        data = (self._smuggling_item_meta_cache or {}).get(item) or {}
         base_price = int(data.get("base_price", base_prices.get(item, 500) or 500))
         required = data.get("required_bribe_level")
         required = self._normalize_required_smuggling_level(required)
@@ -764,7 +1025,7 @@ class EconomyMixin:
         if max_level != 3 and raw_level <= 3:
             scaled = int(round((float(raw_level) / 3.0) * float(max_level)))
             raw_level = max(0, scaled)
-        return int(max(0, min(max_level, raw_level)))
+        return int(_clamp(raw_level, 0, max_level))
 
     def _get_required_smuggling_bribe_level(self, item_name, planet=None):
         target = planet or self.current_planet
@@ -808,23 +1069,21 @@ class EconomyMixin:
         normalized = str(item_name or "").strip()
         if not normalized:
             return False
-        self._load_smuggling_item_cache()
-        return normalized in set(self._smuggling_item_cache or [])
+        return normalized in self._smuggling_item_name_set()
 
     def _get_contraband_profile(self, item_name):
+        """Profile for a contraband item; shared and cached, so treat as read-only.
+
+        Every profile carries all keys with their final types (tier_rank is an
+        int), so callers index directly instead of .get() with defaults.
+        """
         name = str(item_name or "").strip()
         if not name:
-            return {
-                "tier": "LOW",
-                "tier_rank": 1,
-                "price_mult": 1.10,
-                "detection_mult": 0.95,
-                "heat_mult": 0.90,
-            }
+            return _DEFAULT_CONTRABAND_PROFILE
 
         cached = self._contraband_profile_cache.get(name)
         if cached:
-            return dict(cached)
+            return cached
 
         seed = sum((idx + 1) * ord(ch) for idx, ch in enumerate(name.lower()))
         tier_idx = seed % 4
@@ -856,8 +1115,8 @@ class EconomyMixin:
             "detection_mult": float(detection_curve[tier_idx]),
             "heat_mult": float(heat_curve[tier_idx]),
         }
-        self._contraband_profile_cache[name] = dict(profile)
-        return dict(profile)
+        self._contraband_profile_cache[name] = profile
+        return profile
 
     def _get_contraband_detection_chance(self, item_name, planet=None, quantity=1):
         target = planet or self.current_planet
@@ -879,11 +1138,11 @@ class EconomyMixin:
         chance *= 1.0 + (heat * heat_scan_step)
 
         tier_step = float(self.config.get("contraband_detection_tier_step"))
-        chance *= 1.0 + ((int(profile.get("tier_rank", 1)) - 1) * tier_step)
+        chance *= 1.0 + ((profile["tier_rank"] - 1) * tier_step)
 
         item_meta = self._get_smuggling_item_metadata(item_name)
         contraband_base = max(1.0, float(item_meta.get("base_price", 500)))
-        price_ratio = max(0.0, min(2.5, (contraband_base / 4000.0) - 0.25))
+        price_ratio = _clamp((contraband_base / 4000.0) - 0.25, 0.0, 2.5)
         value_step = max(
             0.0, float(self.config.get("contraband_detection_value_step", 0.18))
         )
@@ -921,9 +1180,13 @@ class EconomyMixin:
         if ship and hasattr(ship, "get_effective_scan_evasion_multiplier"):
             chance *= float(ship.get_effective_scan_evasion_multiplier())
 
-        return max(0.01, min(0.95, float(chance)))
+        return _clamp(float(chance), 0.01, 0.95)
 
     def get_contraband_market_context(self, item_name, planet_name=None, quantity=1):
+        with self._economy_request():
+            return self._contraband_market_context(item_name, planet_name, quantity)
+
+    def _contraband_market_context(self, item_name, planet_name=None, quantity=1):
         item = str(item_name or "").strip()
         if not self.is_contraband_item(item):
             return None
@@ -931,9 +1194,7 @@ class EconomyMixin:
         p_name = planet_name or (
             self.current_planet.name if self.current_planet else ""
         )
-        planet = next(
-            (p for p in self.planets if p.name == p_name), self.current_planet
-        )
+        planet = self._planet_named(p_name) or self.current_planet
         if not planet:
             return None
 
@@ -952,7 +1213,7 @@ class EconomyMixin:
         return {
             "item": item,
             "tier": str(profile.get("tier", "LOW")),
-            "tier_rank": int(profile.get("tier_rank", 1)),
+            "tier_rank": profile["tier_rank"],
             "heat": int(heat),
             "security_level": int(getattr(planet, "security_level", 0)),
             "detection_chance": float(chance),
@@ -993,52 +1254,18 @@ class EconomyMixin:
             return current
 
         chance = float(self.config.get("planet_event_chance", 0.24))
-        chance = max(0.0, min(1.0, chance))
-        if random.random() > chance:
+        chance = _clamp(chance, 0.0, 1.0)
+        if _random() > chance:
             return None
 
-        templates = [
-            {
-                "type": "FESTIVAL",
-                "label": "Festival Surge",
-                "desc": "Crowds and celebration spike commodity flow.",
-                "buy_mult": 0.92,
-                "docking_mult": 1.08,
-                "contract_mult": 1.10,
-            },
-            {
-                "type": "EMBARGO",
-                "label": "Trade Embargo",
-                "desc": "Restrictions tighten supply and docking access.",
-                "buy_mult": 1.24,
-                "docking_mult": 1.28,
-                "contract_mult": 1.24,
-            },
-            {
-                "type": "SHORTAGE",
-                "label": "Critical Shortage",
-                "desc": "Essential goods are scarce and margins jump.",
-                "buy_mult": 1.18,
-                "docking_mult": 1.06,
-                "contract_mult": 1.16,
-            },
-            {
-                "type": "STRIKE",
-                "label": "Dockworkers Strike",
-                "desc": "Port throughput drops and schedules destabilize.",
-                "buy_mult": 1.12,
-                "docking_mult": 0.94,
-                "contract_mult": 1.08,
-            },
-        ]
-
-        pick = random.choice(templates)
-        duration_hours = random.randint(2, 6)
+        pick = _choice(_PLANET_EVENT_TEMPLATES)
+        duration_hours = _randint(2, 6)
+        now = time.time()
         event = {
             **pick,
             "planet": planet.name,
-            "created_at": time.time(),
-            "expires_at": time.time() + (duration_hours * 3600),
+            "created_at": now,
+            "expires_at": now + (duration_hours * 3600),
         }
         self.planet_events[planet.name] = event
         return event
@@ -1053,26 +1280,42 @@ class EconomyMixin:
         return self.planet_events.get(p_name)
 
     def _set_port_spotlight_deal(self, planet):
+        """Roll a fresh spotlight deal for ``planet``.
+
+        Returns the arrival headline for the new deal (empty when cleared) so
+        the warp report does not have to re-read and re-format it.
+        """
         if not planet or not planet.items:
             self.current_port_spotlight = None
-            return
+            return ""
 
-        item_name = random.choice(list(planet.items.keys()))
+        item_name = _choice(list(planet.items.keys()))
         min_discount = int(self.config.get("port_spotlight_discount_min"))
         max_discount = int(self.config.get("port_spotlight_discount_max"))
         if max_discount < min_discount:
             max_discount = min_discount
-        discount_pct = max(5, random.randint(min_discount, max_discount))
+        discount_pct = max(5, _randint(min_discount, max_discount))
+        quantity = _randint(4, 12)
 
         self.current_port_spotlight = {
             "planet": planet.name,
             "item": item_name,
-            "discount_pct": int(discount_pct),
-            "quantity": int(random.randint(4, 12)),
+            "discount_pct": discount_pct,
+            "quantity": quantity,
             "expires_at": time.time() + 21600,
         }
+        return (
+            f"PORT SPOTLIGHT: {item_name.upper()} -{discount_pct}% "
+            f"({quantity} UNIT(S))."
+        )
 
-    def get_current_port_spotlight_deal(self):
+    def _live_port_spotlight_deal(self):
+        """The active spotlight dict itself (not a copy), or None.
+
+        Internal readers use this to skip the defensive copy the public
+        getter hands to clients; callers must not mutate it except through
+        the spotlight helpers.
+        """
         deal = self.current_port_spotlight
         if not deal or not self.current_planet:
             return None
@@ -1082,16 +1325,19 @@ class EconomyMixin:
             return None
         if float(deal.get("expires_at", 0)) <= time.time():
             return None
-        return dict(deal)
+        return deal
+
+    def get_current_port_spotlight_deal(self):
+        deal = self._live_port_spotlight_deal()
+        return dict(deal) if deal else None
 
     def _consume_port_spotlight_quantity(self, item_name, amount):
-        deal = self.get_current_port_spotlight_deal()
+        deal = self._live_port_spotlight_deal()
         if not deal:
             return
         if deal.get("item") != item_name:
             return
-        remaining = max(0, int(deal.get("quantity", 0)) - int(amount))
-        self.current_port_spotlight["quantity"] = remaining
+        deal["quantity"] = max(0, int(deal.get("quantity", 0)) - int(amount))
 
     def process_commander_stipend(self):
         if not self.player:
@@ -1167,47 +1413,57 @@ class EconomyMixin:
         if elapsed_hours <= 0.0:
             return
 
-        decay_per_hour = max(
-            0.01,
-            min(0.95, float(self.config.get("economy_momentum_decay_per_hour", 0.10))),
+        decay_per_hour = _clamp(
+            float(self.config.get("economy_momentum_decay_per_hour", 0.10)), 0.01, 0.95
         )
         decay_factor = max(0.0, 1.0 - (decay_per_hour * elapsed_hours))
 
+        # Keys are already strings (normalized on load and on trade impact).
         cleaned_momentum = {}
         for planet_name, items in self.market_momentum.items():
             planet_bucket = {}
             for item_name, value in (items or {}).items():
-                decayed = float(value) * decay_factor
+                decayed = value * decay_factor
                 if abs(decayed) >= 0.0008:
-                    planet_bucket[str(item_name)] = max(-0.45, min(0.45, decayed))
+                    planet_bucket[item_name] = _clamp(decayed, -0.45, 0.45)
             if planet_bucket:
-                cleaned_momentum[str(planet_name)] = planet_bucket
+                cleaned_momentum[planet_name] = planet_bucket
         self.market_momentum = cleaned_momentum
 
         cleaned_volume = {}
         for planet_name, items in self.market_trade_volume.items():
             planet_bucket = {}
             for item_name, value in (items or {}).items():
-                decayed = float(value) * decay_factor
+                decayed = value * decay_factor
                 if decayed >= 0.10:
-                    planet_bucket[str(item_name)] = decayed
+                    planet_bucket[item_name] = decayed
             if planet_bucket:
-                cleaned_volume[str(planet_name)] = planet_bucket
+                cleaned_volume[planet_name] = planet_bucket
         self.market_trade_volume = cleaned_volume
 
         self.last_market_update_time = now
 
     def _get_market_momentum_value(self, planet_name, item_name):
         self._update_market_dynamics()
-        return float(
-            self.market_momentum.get(str(planet_name), {}).get(str(item_name), 0.0)
-        )
+        return self._momentum_raw(str(planet_name), str(item_name))
 
     def _get_market_volume_value(self, planet_name, item_name):
         self._update_market_dynamics()
-        return float(
-            self.market_trade_volume.get(str(planet_name), {}).get(str(item_name), 0.0)
-        )
+        return self._volume_raw(str(planet_name), str(item_name))
+
+    def _momentum_raw(self, planet_name, item_name):
+        """Momentum lookup for str keys; the caller has already run decay."""
+        bucket = self.market_momentum.get(planet_name)
+        if not bucket:
+            return 0.0
+        return bucket.get(item_name, 0.0)
+
+    def _volume_raw(self, planet_name, item_name):
+        """Volume lookup for str keys; the caller has already run decay."""
+        bucket = self.market_trade_volume.get(planet_name)
+        if not bucket:
+            return 0.0
+        return bucket.get(item_name, 0.0)
 
     def _apply_market_trade_impact(self, planet_name, item_name, action, quantity):
         self._update_market_dynamics()
@@ -1217,45 +1473,48 @@ class EconomyMixin:
             return
 
         qty = max(1, int(quantity))
-        step = max(
-            0.003,
-            min(0.08, float(self.config.get("economy_momentum_trade_step", 0.018))),
+        step = _clamp(
+            float(self.config.get("economy_momentum_trade_step", 0.018)), 0.003, 0.08
         )
         impact = step * math.sqrt(float(qty))
         if str(action).upper() == "SELL":
             impact *= -1.0
 
         p_bucket = self.market_momentum.setdefault(p_name, {})
-        p_bucket[i_name] = max(
-            -0.45, min(0.45, float(p_bucket.get(i_name, 0.0)) + impact)
+        p_bucket[i_name] = _clamp(
+            self._momentum_raw(p_name, i_name) + impact, -0.45, 0.45
         )
 
         v_bucket = self.market_trade_volume.setdefault(p_name, {})
-        v_bucket[i_name] = max(0.0, float(v_bucket.get(i_name, 0.0)) + qty)
+        v_bucket[i_name] = max(0.0, self._volume_raw(p_name, i_name) + qty)
 
     def _get_market_price_multiplier(self, planet_name, item_name, action):
-        momentum = self._get_market_momentum_value(planet_name, item_name)
-        volume = self._get_market_volume_value(planet_name, item_name)
+        self._update_market_dynamics()
+        p_name = str(planet_name)
+        i_name = str(item_name)
+        momentum = self._momentum_raw(p_name, i_name)
+        volume = self._volume_raw(p_name, i_name)
+        if not momentum and not volume:
+            # Untouched market: both branches below reduce to exactly 1.0.
+            return 1.0
 
         if str(action).upper() == "SELL":
             mult = 1.0 + (momentum * 0.60)
-            damp_step = max(
+            damp_step = _clamp(
+                float(self.config.get("economy_dampening_volume_step", 0.012)),
                 0.001,
-                min(
-                    0.08, float(self.config.get("economy_dampening_volume_step", 0.012))
-                ),
+                0.08,
             )
-            damp_floor = max(
-                0.45,
-                min(0.95, float(self.config.get("economy_dampening_floor", 0.70))),
+            damp_floor = _clamp(
+                float(self.config.get("economy_dampening_floor", 0.70)), 0.45, 0.95
             )
             damp = max(damp_floor, 1.0 - (volume * damp_step))
             mult *= damp
-            return max(0.45, min(1.45, mult))
+            return _clamp(mult, 0.45, 1.45)
 
         mult = 1.0 + momentum
         mult *= min(1.45, 1.0 + (volume * 0.004))
-        return max(0.65, min(1.85, mult))
+        return _clamp(mult, 0.65, 1.85)
 
     def _send_sector_report_if_due(self):
         if not self.player:
@@ -1312,6 +1571,17 @@ class EconomyMixin:
         self.player.last_sector_report_time = now
 
     def get_effective_buy_price(self, item_name, base_price, planet_name=None):
+        scope = getattr(self, "_request_scope", None)
+        if scope is None:
+            return self._effective_buy_price(item_name, base_price, planet_name)
+        key = ("buy_price", item_name, base_price, planet_name)
+        price = scope.get(key)
+        if price is None:
+            price = self._effective_buy_price(item_name, base_price, planet_name)
+            scope[key] = price
+        return price
+
+    def _effective_buy_price(self, item_name, base_price, planet_name=None):
         self._apply_market_rotation_if_due()
         if not self.player:
             return int(base_price)
@@ -1323,14 +1593,14 @@ class EconomyMixin:
         if self._is_planet_price_penalty_active(p_name):
             price = int(round(price * self.planet_price_penalty_multiplier))
 
-        spotlight = self.get_current_port_spotlight_deal()
+        spotlight = self._live_port_spotlight_deal()
         if (
             spotlight
             and spotlight.get("planet") == p_name
             and spotlight.get("item") == item_name
         ):
-            discount = max(
-                0.0, min(0.90, float(spotlight.get("discount_pct", 0)) / 100.0)
+            discount = _clamp(
+                float(spotlight.get("discount_pct", 0)) / 100.0, 0.0, 0.90
             )
             price = int(round(price * (1.0 - discount)))
 
@@ -1375,12 +1645,9 @@ class EconomyMixin:
                     )
                 )
 
-        price = int(
-            round(
-                price
-                * self._get_market_price_multiplier(p_name, item_name, action="BUY")
-            )
-        )
+        market_mult = self._get_market_price_multiplier(p_name, item_name, action="BUY")
+        if market_mult != 1.0:
+            price = int(round(price * market_mult))
         return max(1, price)
 
     def get_market_sell_price(self, item_name, planet_name=None):
@@ -1388,9 +1655,7 @@ class EconomyMixin:
         p_name = planet_name or (
             self.current_planet.name if self.current_planet else None
         )
-        planet = next(
-            (p for p in self.planets if p.name == p_name), self.current_planet
-        )
+        planet = self._planet_named(p_name) or self.current_planet
 
         if planet:
             if item_name in planet.items:
@@ -1400,6 +1665,8 @@ class EconomyMixin:
                 sell_mult = self._get_market_price_multiplier(
                     planet.name, item_name, action="SELL"
                 )
+                if sell_mult == 1.0:
+                    return max(1, base_market)
                 return max(1, int(round(base_market * sell_mult)))
             if item_name in planet.smuggling_inventory:
                 smuggle_base = planet.get_smuggling_price(item_name) or 800
@@ -1409,36 +1676,28 @@ class EconomyMixin:
                 sell_mult = self._get_market_price_multiplier(
                     planet.name, item_name, action="SELL"
                 )
+                cfg = self._economy_cfg()
                 profile = self._get_contraband_profile(item_name)
-                tier_step = float(self.config.get("contraband_price_tier_step"))
-                contraband_mult = 1.0 + (
-                    (int(profile.get("tier_rank", 1)) - 1) * tier_step * 0.55
-                )
                 item_meta = self._get_smuggling_item_metadata(item_name)
-                value_ratio = max(
-                    0.0, min(2.0, float(item_meta.get("base_price", 500)) / 4000.0)
+                contraband_mult = _contraband_sell_multiplier(
+                    profile["tier_rank"],
+                    cfg.contraband_price_tier_step,
+                    float(item_meta.get("base_price", 500)),
+                    self._get_bribe_level(planet.name),
+                    cfg.bribe_smuggling_sell_bonus_per_level,
                 )
-                contraband_mult *= 1.0 + (value_ratio * 0.10)
-                bribe_level = self._get_bribe_level(planet.name)
-                bribe_sell_bonus = float(
-                    self.config.get("bribe_smuggling_sell_bonus_per_level")
-                )
-                contraband_mult *= 1.0 + (max(0, bribe_level) * bribe_sell_bonus)
                 return max(1, int(round(base_market * sell_mult * contraband_mult)))
 
         base_value = int(base_prices.get(item_name, 200))
         salvage_multiplier = float(self.config.get("salvage_sell_multiplier"))
-        salvage_multiplier = max(0.05, min(1.0, salvage_multiplier))
+        salvage_multiplier = _clamp(salvage_multiplier, 0.05, 1.0)
         raw_price = int(round(base_value * salvage_multiplier))
         if p_name:
-            raw_price = int(
-                round(
-                    raw_price
-                    * self._get_market_price_multiplier(
-                        p_name, item_name, action="SELL"
-                    )
-                )
+            sell_mult = self._get_market_price_multiplier(
+                p_name, item_name, action="SELL"
             )
+            if sell_mult != 1.0:
+                raw_price = int(round(raw_price * sell_mult))
         return max(1, raw_price)
 
     def is_planet_hostile_market(self, planet_name=None):
@@ -1478,62 +1737,74 @@ class EconomyMixin:
         return remaining
 
     def get_best_trade_opportunities(self, planet_name=None, limit=3):
+        with self._economy_request():
+            return self._best_trade_opportunities(planet_name, limit)
+
+    def _best_trade_opportunities(self, planet_name=None, limit=3):
         origin_name = planet_name or (
             self.current_planet.name if self.current_planet else None
         )
         if not origin_name:
             return []
 
-        origin_planet = next((p for p in self.planets if p.name == origin_name), None)
+        origin_planet = self._planet_named(origin_name)
         if not origin_planet:
             return []
 
+        # Rotate first so the price snapshots below stay valid for the scan.
+        self._apply_market_rotation_if_due()
+        get_price = self.get_effective_buy_price
+        origin_name = origin_planet.name
+        item_index = self._get_item_index()
+
         opportunities = []
         for item_name, origin_base_price in origin_planet.items.items():
-            buy_price = self.get_effective_buy_price(
-                item_name, origin_base_price, origin_planet.name
+            buy_price = get_price(item_name, origin_base_price, origin_name)
+            # max() keeps the first best offer, matching the old strict ">" scan.
+            best = max(
+                (
+                    (get_price(item_name, dest_base_price, dest.name), dest.name)
+                    for dest, dest_base_price in item_index.get(item_name, ())
+                    if dest.name != origin_name
+                ),
+                key=itemgetter(0),
+                default=None,
             )
-
-            best_destination = None
-            best_sell_price = 0
-            best_profit = 0
-
-            for destination in self.planets:
-                if destination.name == origin_planet.name:
-                    continue
-                if item_name not in destination.items:
-                    continue
-
-                sell_price = self.get_effective_buy_price(
-                    item_name, destination.items[item_name], destination.name
-                )
-                profit = sell_price - buy_price
-                if profit > best_profit:
-                    best_profit = profit
-                    best_destination = destination.name
-                    best_sell_price = sell_price
-
-            if best_destination and best_profit > 0:
-                opportunities.append(
-                    {
-                        "item": item_name,
-                        "buy_price": int(buy_price),
-                        "sell_planet": best_destination,
-                        "sell_price": int(best_sell_price),
-                        "profit": int(best_profit),
-                    }
+            if best is None or best[0] <= buy_price:
+                continue
+            sell_price, sell_planet = best
+            opportunities.append(
+                (
+                    int(sell_price - buy_price),
+                    int(sell_price),
+                    item_name,
+                    int(buy_price),
+                    sell_planet,
                 )
+            )
 
-        opportunities.sort(key=lambda o: (o["profit"], o["sell_price"]), reverse=True)
-        return opportunities[: max(1, int(limit))]
+        # Rank plain tuples; only the top entries are turned into dicts.
+        top = heapq.nlargest(max(1, int(limit)), opportunities, key=itemgetter(0, 1))
+        return [
+            {
+                "item": item_name,
+                "buy_price": buy_price,
+                "sell_planet": sell_planet,
+                "sell_price": sell_price,
+                "profit": profit,
+            }
+            for profit, sell_price, item_name, buy_price, sell_planet in top
+        ]
 
-    def get_active_trade_contract(self):
+    def get_active_trade_contract(self, now=None):
         contract = self.active_trade_contract
         if not contract:
             return None
 
-        expires_at = float(contract.get("expires_at", 0))
-        if expires_at > 0 and time.time() >= expires_at:
+        if now is None:
+            now = time.time()
+        expires_at = float(contract.get("expires_at") or 0)
+        if expires_at > 0 and now >= expires_at:
             self.active_trade_contract = None
             self._set_contract_chain_streak(0)
             return None
@@ -1545,13 +1816,12 @@ class EconomyMixin:
             self.active_trade_contract = None
             return None
 
-        contract_view = dict(contract)
-        contract_view.setdefault("arc_total_steps", 1)
-        contract_view.setdefault("arc_step", 1)
-        contract_view.setdefault("route_type", "LEGAL")
-        contract_view["remaining_qty"] = remaining
-        contract_view["remaining_seconds"] = max(0, int(expires_at - time.time()))
-        return contract_view
+        # A view: the derived fields never land on the stored contract.
+        return {
+            **contract,
+            "remaining_qty": remaining,
+            "remaining_seconds": max(0, int(expires_at - now)),
+        }
 
     def _pick_contract_route(self):
         authority = self._get_authority_standing()
@@ -1563,10 +1833,12 @@ class EconomyMixin:
     def _generate_trade_contract(self, force=False, arc_state=None):
         if not self.player or not self.current_planet:
             return False, ""
-        if not self.config.get("enable_trade_contracts"):
+        cfg_get = self.config.get
+        if not cfg_get("enable_trade_contracts"):
             return False, ""
 
-        if self.get_active_trade_contract() and not force:
+        now = time.time()
+        if self.get_active_trade_contract(now) and not force:
             return False, ""
 
         opportunities = self.get_best_trade_opportunities(
@@ -1578,7 +1850,7 @@ class EconomyMixin:
         route_type = "LEGAL"
         arc_step = 1
         arc_total_steps = 1
-        arc_id = f"arc-{int(time.time())}-{random.randint(100, 999)}"
+        arc_id = f"arc-{int(now)}-{_randint(100, 999)}"
         if arc_state:
             route_type = str(arc_state.get("route_type", "LEGAL")).upper()
             arc_step = max(1, int(arc_state.get("arc_step", 1)))
@@ -1586,10 +1858,10 @@ class EconomyMixin:
             arc_id = str(arc_state.get("arc_id", arc_id))
         else:
             route_type = self._pick_contract_route()
-            arc_total_steps = random.randint(2, 4)
+            arc_total_steps = _randint(2, 4)
             arc_step = 1
 
-        smuggling_items = set(self.get_smuggling_item_names())
+        smuggling_items = self._smuggling_item_name_set()
         if route_type == "SMUGGLING":
             route_filtered = [o for o in opportunities if o["item"] in smuggling_items]
         else:
@@ -1599,8 +1871,8 @@ class EconomyMixin:
         if route_filtered:
             opportunities = route_filtered
 
-        pick_pool = opportunities[: max(1, min(4, len(opportunities)))]
-        pick = random.choice(pick_pool)
+        pick_pool = opportunities[: _clamp(len(opportunities), 1, 4)]
+        pick = _choice(pick_pool)
 
         ship_cargo = max(
             5,
@@ -1610,16 +1882,16 @@ class EconomyMixin:
                 else self.player.spaceship.current_cargo_pods
             ),
         )
-        qty_low = max(3, min(8, ship_cargo // 6))
-        qty_high = max(qty_low, min(20, ship_cargo // 3))
-        quantity = random.randint(qty_low, qty_high)
+        qty_low = _clamp(ship_cargo // 6, 3, 8)
+        qty_high = _clamp(ship_cargo // 3, qty_low, 20)
+        quantity = _randint(qty_low, qty_high)
 
-        reward_mult = float(self.config.get("trade_contract_reward_multiplier"))
+        reward_mult = float(cfg_get("trade_contract_reward_multiplier"))
         chain_bonus = self._get_contract_chain_bonus_factor()
         event_mult = 1.0
         evt = self.get_planet_event(self.current_planet.name)
         if evt:
-            event_mult = max(0.75, min(1.8, float(evt.get("contract_mult", 1.0))))
+            event_mult = _clamp(float(evt.get("contract_mult", 1.0)), 0.75, 1.8)
         reward = int(
             max(
                 200,
@@ -1630,8 +1902,7 @@ class EconomyMixin:
                 * event_mult,
             )
         )
-        hours = max(1, int(self.config.get("trade_contract_hours")))
-        now = time.time()
+        hours = max(1, int(cfg_get("trade_contract_hours")))
 
         self.active_trade_contract = {
             "item": pick["item"],
@@ -1683,17 +1954,14 @@ class EconomyMixin:
         if remaining <= 0:
             return False, ""
 
-        delivered = min(int(sold_qty), remaining)
-        self.active_trade_contract["delivered"] = int(
-            self.active_trade_contract.get("delivered", 0) + delivered
+        delivered_total = int(contract.get("delivered", 0)) + min(
+            int(sold_qty), remaining
         )
+        self.active_trade_contract["delivered"] = delivered_total
 
-        left = int(
-            self.active_trade_contract["quantity"]
-            - self.active_trade_contract["delivered"]
-        )
+        left = int(contract["quantity"]) - delivered_total
         if left <= 0:
-            completed = dict(self.active_trade_contract)
+            completed = contract
             reward = int(completed.get("reward", 0))
             self.player.credits += reward
             self.active_trade_contract = None
@@ -1744,6 +2012,14 @@ class EconomyMixin:
 
     def get_item_market_snapshot(
         self, item_name, origin_planet_name=None, compare_planet_name=None
+    ):
+        with self._economy_request():
+            return self._item_market_snapshot(
+                item_name, origin_planet_name, compare_planet_name
+            )
+
+    def _item_market_snapshot(
+        self, item_name, origin_planet_name=None, compare_planet_name=None
     ):
         origin_name = origin_planet_name or (
             self.current_planet.name if self.current_planet else None
@@ -1751,32 +2027,30 @@ class EconomyMixin:
         if not origin_name:
             return None
 
-        origin_planet = next((p for p in self.planets if p.name == origin_name), None)
+        origin_planet = self._planet_named(origin_name)
         if not origin_planet:
             return None
-        if item_name not in origin_planet.items:
+        self._apply_market_rotation_if_due()
+        origin_base_price = origin_planet.items.get(item_name)
+        if origin_base_price is None:
             return None
 
         origin_price = self.get_effective_buy_price(
-            item_name, origin_planet.items[item_name], origin_planet.name
+            item_name, origin_base_price, origin_planet.name
         )
 
-        offers = []
-        for p in self.planets:
-            if item_name not in p.items:
-                continue
-            eff = self.get_effective_buy_price(item_name, p.items[item_name], p.name)
-            offers.append((p.name, int(eff)))
-
-        if not offers:
-            return None
-
-        avg_price = int(sum(price for _, price in offers) / len(offers))
-
+        # Average and best destination are accumulated in the pricing pass.
+        get_price = self.get_effective_buy_price
+        total_price = 0
+        offer_count = 0
         best_sell_planet = None
         best_sell_price = origin_price
         best_profit = 0
-        for p_name, sell_price in offers:
+        for p, base_price in self._get_item_index().get(item_name, ()):
+            p_name = p.name
+            sell_price = int(get_price(item_name, base_price, p_name))
+            total_price += sell_price
+            offer_count += 1
             if p_name == origin_name:
                 continue
             profit = sell_price - origin_price
@@ -1785,12 +2059,15 @@ class EconomyMixin:
                 best_sell_planet = p_name
                 best_sell_price = sell_price
 
+        if not offer_count:
+            return None
+
+        avg_price = int(total_price / offer_count)
+
         compare_price = None
         compare_delta = 0
         if compare_planet_name:
-            compare_planet = next(
-                (p for p in self.planets if p.name == compare_planet_name), None
-            )
+            compare_planet = self._planet_named(compare_planet_name)
             if compare_planet and item_name in compare_planet.items:
                 compare_price = self.get_effective_buy_price(
                     item_name, compare_planet.items[item_name], compare_planet.name
@@ -1811,7 +2088,8 @@ class EconomyMixin:
 
     def bribe_npc(self):
         planet = self.current_planet
-        self._refresh_bribe_registry()
+        now = time.time()
+        self._refresh_bribe_registry(now)
         quote = self._get_bribe_quote(planet)
         if not quote.get("can_bribe", False):
             reason = str(quote.get("reason", "This individual cannot be bribed."))
@@ -1835,23 +2113,22 @@ class EconomyMixin:
                 next_level * float(self.config.get("bribe_duration_per_level_hours"))
             ),
         )
-        expires_at = time.time() + (duration_h * 3600.0)
+        expires_at = now + (duration_h * 3600.0)
         self.bribe_registry[planet.name] = {
             "level": int(next_level),
             "expires_at": float(expires_at),
         }
-        self._refresh_bribe_registry()
+        self._refresh_bribe_registry(now)
 
         auth_hit = max(1, int(self.config.get("bribe_authority_hit_per_level")))
         front_gain = max(1, int(self.config.get("bribe_frontier_gain_per_level")))
-        new_auth = self._adjust_authority_standing(-auth_hit * max(1, next_level))
-        new_frontier = self._adjust_frontier_standing(front_gain * max(1, next_level))
+        level_mult = max(1, next_level)
+        new_auth = self._adjust_authority_standing(-auth_hit * level_mult)
+        new_frontier = self._adjust_frontier_standing(front_gain * level_mult)
 
-        heat_drop = int(self.config.get("bribe_heat_reduction_per_level")) * max(
-            1, next_level
-        )
+        heat_drop = int(self.config.get("bribe_heat_reduction_per_level")) * level_mult
         heat_after = self._adjust_law_heat(planet.name, -heat_drop)
-        remaining = self._get_bribe_time_remaining_seconds(planet.name)
+        remaining = self._get_bribe_time_remaining_seconds(planet.name, now)
 
         return (
             True,
@@ -1867,34 +2144,25 @@ class EconomyMixin:
         self._update_law_heat_decay()
         self._normalize_player_inventory()
         item_name = self._canonical_item_name(item_name)
+        q = max(1, int(quantity))
 
         # Security Check for Smuggling
-        smuggling_item_names = self.get_smuggling_item_names()
-
-        is_contraband = item_name in smuggling_item_names
+        is_contraband = item_name in self._smuggling_item_name_set()
         contraband_profile = (
             self._get_contraband_profile(item_name) if is_contraband else None
         )
 
+        cfg = self._economy_cfg()
+
         if is_contraband and planet.security_level > 0:
             chance = self._get_contraband_detection_chance(
                 item_name,
                 planet=planet,
-                quantity=max(1, int(quantity)),
+                quantity=q,
             )
-            if random.random() < chance:
-                ship_level = max(1, int(self.get_ship_level()))
-                heat_ship_step = max(
-                    0.0,
-                    float(self.config.get("law_heat_detected_ship_level_step", 0.18)),
-                )
-                detected_heat = int(
-                    round(
-                        int(self.config.get("law_heat_gain_detected", 8))
-                        * (1.0 + ((ship_level - 1) * heat_ship_step))
-                    )
-                )
-                heat_after = self._adjust_law_heat(planet.name, max(1, detected_heat))
+            if _random() < chance:
+                detected_heat = cfg.detected_heat(max(1, int(self.get_ship_level())))
+                heat_after = self._adjust_law_heat(planet.name, detected_heat)
                 if planet.security_level == 2:
                     return (
                         False,
@@ -1958,13 +2226,9 @@ class EconomyMixin:
                         f"CONTRABAND ACCESS DENIED. SHIP LEVEL 4 REQUIRED (CURRENT {ship_level}).",
                     )
                 frontier_rep = max(0, self._get_frontier_standing())
-                discount_step = float(
-                    self.config.get("frontier_smuggling_discount_step", 0.005)
-                )
+                discount_step = cfg.frontier_smuggling_discount_step
                 bribe_level = self._get_bribe_level(planet.name)
-                bribe_discount_step = float(
-                    self.config.get("bribe_smuggling_discount_per_level")
-                )
+                bribe_discount_step = cfg.bribe_smuggling_discount_per_level
                 smuggle_discount = min(
                     0.40,
                     (frontier_rep * discount_step)
@@ -1984,7 +2248,7 @@ class EconomyMixin:
                     player.smuggling_runs = int(getattr(player, "smuggling_runs", 0)) + 1
                     player.smuggling_units_moved = int(
                         getattr(player, "smuggling_units_moved", 0)
-                    ) + int(max(1, quantity))
+                    ) + q
                     planet.smuggling_inventory[item_name]["quantity"] -= quantity
                     if planet.smuggling_inventory[item_name]["quantity"] <= 0:
                         del planet.smuggling_inventory[item_name]
@@ -1992,23 +2256,21 @@ class EconomyMixin:
                     self._apply_market_trade_impact(
                         planet.name, item_name, "BUY", quantity
                     )
-                    heat_delta = int(self.config.get("law_heat_gain_trade", 2))
+                    heat_base = cfg.law_heat_gain_trade
                     if contraband_profile:
-                        heat_delta = int(
-                            round(
-                                heat_delta
-                                * float(contraband_profile.get("heat_mult", 1.0))
-                            )
-                        )
+                        heat_mult = float(contraband_profile.get("heat_mult", 1.0))
+                        heat_base = int(round(heat_base * heat_mult))
                     item_meta = self._get_smuggling_item_metadata(item_name)
-                    value_ratio = max(
-                        0.0, min(2.5, float(item_meta.get("base_price", 500)) / 4000.0)
-                    )
-                    heat_delta = int(
-                        round(float(heat_delta) * (1.0 + (value_ratio * 0.45)))
+                    value_ratio = _clamp(
+                        float(item_meta.get("base_price", 500)) / 4000.0, 0.0, 2.5
                     )
                     heat_after = self._adjust_law_heat(
-                        planet.name, max(1, heat_delta * max(1, int(quantity)))
+                        planet.name,
+                        max(
+                            1,
+                            int(round(heat_base * (1.0 + (value_ratio * 0.45))))
+                            * q,
+                        ),
                     )
                     tier = (
                         str(contraband_profile.get("tier", "LOW"))
@@ -2029,109 +2291,59 @@ class EconomyMixin:
             # If we sell a smuggling item to a planet that has it in its inventory, increase its quantity
             if is_contraband:
                 bribe_level = self._get_bribe_level(planet.name)
-                sell_bonus_step = float(
-                    self.config.get("bribe_smuggling_sell_bonus_per_level")
+                sell_mult = 1.0 + (
+                    max(0, bribe_level) * cfg.bribe_smuggling_sell_bonus_per_level
                 )
-                sell_mult = 1.0 + (max(0, bribe_level) * sell_bonus_step)
                 if not planet.is_smuggler_hub and bribe_level <= 0:
-                    sell_mult *= max(
-                        0.35,
-                        float(self.config.get("smuggle_nonhub_sell_penalty")),
-                    )
+                    sell_mult *= cfg.smuggle_nonhub_sell_penalty
                 price = max(1, int(round(price * sell_mult)))
 
-            success, msg = player.sell_item(item_name, price, quantity)
-            if success and is_contraband and item_name in planet.smuggling_inventory:
+            proceeds = self._settle_sell(item_name, price, quantity)
+            if proceeds is None:
+                return False, f"You don't have enough {item_name}!"
+            player.credits += proceeds
+            parts = [f"Sold {quantity}x {item_name}."]
+            if is_contraband and item_name in planet.smuggling_inventory:
                 planet.smuggling_inventory[item_name]["quantity"] += quantity
-            if success:
-                player.smuggling_runs = int(getattr(player, "smuggling_runs", 0)) + 1
-                player.smuggling_units_moved = int(
-                    getattr(player, "smuggling_units_moved", 0)
-                ) + int(max(1, quantity))
-                self._apply_market_trade_impact(
-                    planet.name, item_name, "SELL", quantity
-                )
-            if success and is_contraband:
-                rep_penalty_per_unit = abs(
-                    int(self.config.get("reputation_contraband_trade_penalty"))
-                )
+            if is_contraband:
+                rep_penalty_per_unit = cfg.reputation_contraband_trade_penalty
+                frontier_gain_per_unit = cfg.frontier_contraband_trade_bonus
                 if contraband_profile:
+                    tier_steps = contraband_profile["tier_rank"] - 1
                     rep_penalty_per_unit = max(
+                        1,
+                        int(round(rep_penalty_per_unit * (1.0 + (tier_steps * 0.35)))),
+                    )
+                    frontier_gain_per_unit = max(
                         1,
                         int(
-                            round(
-                                rep_penalty_per_unit
-                                * (
-                                    1.0
-                                    + (
-                                        (
-                                            int(contraband_profile.get("tier_rank", 1))
-                                            - 1
-                                        )
-                                        * 0.35
-                                    )
-                                )
-                            )
+                            round(frontier_gain_per_unit * (1.0 + (tier_steps * 0.20)))
                         ),
                     )
                 item_meta = self._get_smuggling_item_metadata(item_name)
-                value_ratio = max(
-                    0.0, min(2.5, float(item_meta.get("base_price", 500)) / 3500.0)
+                value_ratio = _clamp(
+                    float(item_meta.get("base_price", 500)) / 3500.0, 0.0, 2.5
                 )
                 rep_penalty_per_unit = max(
                     rep_penalty_per_unit,
                     int(round(rep_penalty_per_unit * (1.0 + (value_ratio * 0.55)))),
                 )
-                heat_after = self._adjust_law_heat(
-                    planet.name,
-                    max(1, int(self.config.get("law_heat_gain_trade", 2)))
-                    * max(1, int(quantity)),
-                )
-                heat_after = self._adjust_law_heat(
-                    planet.name,
-                    max(
-                        0,
-                        int(
-                            round(
-                                max(0.0, value_ratio - 0.35)
-                                * 4.0
-                                * max(1, int(quantity))
-                            )
-                        ),
-                    ),
+                # Base trade heat plus the high-value surcharge; both are
+                # non-negative, so one clamped update matches two.
+                heat_delta_total = max(1, cfg.law_heat_gain_trade) * q
+                heat_delta_total += max(
+                    0, int(round(max(0.0, value_ratio - 0.35) * 4.0 * q))
                 )
-                heat_penalty_step = float(
-                    self.config.get("law_heat_penalty_step", 0.20)
+                heat_after = self._adjust_law_heat(planet.name, heat_delta_total)
+                heat_penalty_mult = 1.0 + (
+                    (heat_after / 100.0) * cfg.law_heat_penalty_step
                 )
-                heat_penalty_mult = 1.0 + ((heat_after / 100.0) * heat_penalty_step)
                 rep_hit = max(
                     1,
                     int(
                         round(int(quantity) * rep_penalty_per_unit * heat_penalty_mult)
                     ),
                 )
-                frontier_gain_per_unit = abs(
-                    int(self.config.get("frontier_contraband_trade_bonus", 1))
-                )
-                if contraband_profile:
-                    frontier_gain_per_unit = max(
-                        1,
-                        int(
-                            round(
-                                frontier_gain_per_unit
-                                * (
-                                    1.0
-                                    + (
-                                        (
-                                            int(contraband_profile.get("tier_rank", 1))
-                                            - 1
-                                        )
-                                        * 0.20
-                                    )
-                                )
-                            )
-                        ),
-                    )
                 frontier_gain = max(1, int(quantity) * frontier_gain_per_unit)
                 new_auth = self._adjust_authority_standing(-rep_hit)
                 new_frontier = self._adjust_frontier_standing(frontier_gain)
@@ -2140,14 +2352,15 @@ class EconomyMixin:
                     if contraband_profile
                     else "LOW"
                 )
-                msg += f" {tier} TRADE LOGGED. AUTH {new_auth:+d} | FRONTIER {new_frontier:+d} | HEAT {heat_after}%."
-            if success and used_salvage_buyback:
-                msg += " OFFLOADED VIA LOCAL SALVAGE BROKER."
-            if success:
-                c_prog, c_msg = self._apply_trade_contract_progress(item_name, quantity)
-                if c_prog and c_msg:
-                    msg += f" {c_msg}"
-            return success, msg
+                parts.append(
+                    f"{tier} TRADE LOGGED. AUTH {new_auth:+d} | FRONTIER {new_frontier:+d} | HEAT {heat_after}%."
+                )
+            if used_salvage_buyback:
+                parts.append("OFFLOADED VIA LOCAL SALVAGE BROKER.")
+            c_prog, c_msg = self._apply_trade_contract_progress(item_name, quantity)
+            if c_prog and c_msg:
+                parts.append(c_msg)
+            return True, " ".join(parts)
 
         return False, "Invalid action."
 
@@ -2156,94 +2369,152 @@ class EconomyMixin:
             return False, ""
 
         planet = self.current_planet
-        buyable = set(planet.items.keys())
-        for smuggle_item, data in dict(
-            getattr(planet, "smuggling_inventory", {}) or {}
-        ).items():
-            if int((data or {}).get("quantity", 0)) <= 0:
-                continue
-            if self._is_smuggling_item_access_open(smuggle_item, planet):
-                buyable.add(smuggle_item)
+        inventory = self.player.inventory
+        # Set algebra on the key views narrows the hold to off-market cargo;
+        # the list below still walks the hold so sale order stays stable.
+        non_market = inventory.keys() - planet.market_item_names()
+        if not non_market:
+            return False, "NO NON-MARKET CARGO TO QUICK-SELL."
+        non_market -= {
+            smuggle_item
+            for smuggle_item, data in planet.smuggling_inventory.items()
+            if smuggle_item in non_market
+            and int((data or {}).get("quantity", 0)) > 0
+            and self._is_smuggling_item_access_open(smuggle_item, planet)
+        }
+
+        sold_items, sold_units, earned = self._quick_sell_batch(
+            [
+                (item_name, int(qty))
+                for item_name, qty in inventory.items()
+                if qty > 0 and item_name in non_market
+            ]
+        )
+        if sold_items <= 0:
+            return False, "NO NON-MARKET CARGO TO QUICK-SELL."
 
+        summary = f"QUICK-SOLD {sold_units} UNIT(S) ACROSS {sold_items} ITEM TYPE(S) FOR {earned:,} CR."
+        return True, summary
+
+    def _settle_sell(self, item_name, price, qty):
+        """Shared SELL bookkeeping: hold debit, run counters, market impact.
+
+        Returns the proceeds for the caller to credit (None if the hold is
+        short), so batch sells can add one total. Contract progress stays with
+        the caller because trade_item must apply contraband standing first.
+        """
+        player = self.player
+        inventory = player.inventory
+        if inventory.get(item_name, 0) < qty:
+            return None
+        inventory[item_name] -= qty
+        if inventory[item_name] == 0:
+            del inventory[item_name]
+        player.smuggling_runs = int(getattr(player, "smuggling_runs", 0)) + 1
+        player.smuggling_units_moved = int(
+            getattr(player, "smuggling_units_moved", 0)
+        ) + max(1, int(qty))
+        self._apply_market_trade_impact(
+            self.current_planet.name, item_name, "SELL", qty
+        )
+        return price * qty
+
+    def _quick_sell_batch(self, items):
+        """Sell (item, qty) pairs at the salvage broker in one pass.
+
+        Legal cargo the port does not trade is settled inline with one shared
+        rotation/bribe/heat refresh. Contraband and anything the port lists
+        still goes through trade_item so scans, heat and standing apply.
+        Returns (item types sold, units sold, credits earned).
+        """
+        planet = self.current_planet
+        player = self.player
+        start_credits = int(player.credits)
+        self._apply_market_rotation_if_due()
+        self._refresh_bribe_registry()
+        self._update_law_heat_decay()
+        self._normalize_player_inventory()
+
+        contraband_names = self._smuggling_item_name_set()
+        market_items = planet.market_item_names()
+        inventory = player.inventory
+        salvage_credits = 0
         sold_items = 0
         sold_units = 0
-        start_credits = int(self.player.credits)
-        messages = []
+        for item_name, qty in items:
+            item_name = self._canonical_item_name(item_name)
+            if (
+                item_name in contraband_names
+                or item_name in market_items
+                or item_name in planet.smuggling_inventory
+            ):
+                success, _msg = self.trade_item(item_name, "SELL", qty)
+                if success:
+                    sold_items += 1
+                    sold_units += qty
+                continue
 
-        for item_name, qty in list(self.player.inventory.items()):
-            if qty <= 0 or item_name in buyable:
+            price = self.get_market_sell_price(item_name, planet.name)
+            proceeds = self._settle_sell(item_name, price, qty)
+            if proceeds is None:
                 continue
-            success, msg = self.trade_item(item_name, "SELL", int(qty))
-            if success:
-                sold_items += 1
-                sold_units += int(qty)
-                if msg:
-                    messages.append(msg)
+            salvage_credits += proceeds
+            self._apply_trade_contract_progress(item_name, qty)
+            sold_items += 1
+            sold_units += qty
 
-        if sold_items <= 0:
-            return False, "NO NON-MARKET CARGO TO QUICK-SELL."
+        player.credits += salvage_credits
+        return sold_items, sold_units, int(player.credits - start_credits)
 
-        earned = int(self.player.credits - start_credits)
-        summary = f"QUICK-SOLD {sold_units} UNIT(S) ACROSS {sold_items} ITEM TYPE(S) FOR {earned:,} CR."
-        if messages:
-            return True, f"{summary}"
-        return True, summary
+    def check_contraband_detection(self, roll=None):
+        """Checks if current planet security detects contraband in player's hold.
 
-    def check_contraband_detection(self):
-        """Checks if current planet security detects contraband in player's hold."""
+        roll lets a caller that already drew a number in [0, 1) supply it;
+        by default one is drawn here.
+        """
         self._refresh_bribe_registry()
         if self.current_planet.security_level <= 0:
             return False, ""
 
-        contraband_names = set(self.get_smuggling_item_names())
+        contraband_names = self._smuggling_item_name_set()
+        inventory = self.player.inventory
+        if inventory.keys().isdisjoint(contraband_names):
+            return False, ""
         contraband_in_hold = {
             item: int(qty)
-            for item, qty in self.player.inventory.items()
+            for item, qty in inventory.items()
             if item in contraband_names and int(qty) > 0
         }
-        has_contraband = bool(contraband_in_hold)
-
-        if not has_contraband:
+        if not contraband_in_hold:
             return False, ""
 
+        profiles = {
+            item: self._get_contraband_profile(item) for item in contraband_in_hold
+        }
+        # Profiles always carry an int tier_rank, so rank on plain tuples.
         highest_item = max(
-            contraband_in_hold.keys(),
-            key=lambda item: (
-                int(self._get_contraband_profile(item).get("tier_rank", 1)),
-                int(contraband_in_hold.get(item, 0)),
-            ),
-        )
-        total_qty = max(1, sum(int(v) for v in contraband_in_hold.values()))
+            [
+                (item, (profiles[item]["tier_rank"], qty))
+                for item, qty in contraband_in_hold.items()
+            ],
+            key=itemgetter(1),
+        )[0]
+        total_qty = max(1, sum(contraband_in_hold.values()))
         chance = self._get_contraband_detection_chance(
             highest_item,
             planet=self.current_planet,
             quantity=total_qty,
         )
-        if random.random() < chance:
-            ship_level = max(1, int(self.get_ship_level()))
-            heat_ship_step = max(
-                0.0,
-                float(self.config.get("law_heat_detected_ship_level_step", 0.18)),
-            )
-            detected_heat = int(
-                round(
-                    int(self.config.get("law_heat_gain_detected", 8))
-                    * (1.0 + ((ship_level - 1) * heat_ship_step))
-                )
+        if roll is None:
+            roll = _random()
+        if roll < chance:
+            cfg = self._economy_cfg()
+            detected_heat = cfg.detected_heat(max(1, int(self.get_ship_level())))
+            heat_after = self._adjust_law_heat(self.current_planet.name, detected_heat)
+            return True, self.current_planet.contraband_alert_template().format(
+                tier=profiles[highest_item].get("tier", "HIGH"),
+                item=highest_item.upper(),
+                heat=heat_after,
             )
-            heat_after = self._adjust_law_heat(
-                self.current_planet.name, max(1, detected_heat)
-            )
-            profile = self._get_contraband_profile(highest_item)
-            if self.current_planet.security_level == 2:
-                return (
-                    True,
-                    f"SECURITY ALERT! {self.current_planet.vendor} SCANNERS DETECTED {profile.get('tier', 'HIGH')} CONTRABAND ({highest_item.upper()}). HEAT {heat_after}%! PREPARE TO BE BOARDED!",
-                )
-            else:
-                return (
-                    True,
-                    f"SECURITY WARNING: {self.current_planet.vendor} flagged your vessel for contraband signatures ({highest_item.upper()}). HEAT {heat_after}%.",
-                )
 
         return False, ""
@@ -1,10 +1,18 @@
 import time
+from bisect import bisect_right
+
+# Standings are ints; bisect_right over these cut points maps a value to its
+# label band (<= -60, <= -25, neutral, >= 25, >= 60).
+_STANDING_CUTS = (-59, -24, 25, 60)
+_AUTHORITY_LABELS = ("WANTED", "SUSPECT", "NEUTRAL", "TRUSTED", "HEROIC")
+_FRONTIER_LABELS = ("OUTCAST", "UNTRUSTED", "NEUTRAL", "CONNECTED", "LEGENDARY")
+
 
 class FactionMixin:
     def _get_combat_win_streak(self):
             if not self.player:
                 return 0
-            return int(getattr(self.player, "combat_win_streak", 0))
+            return int(self.player.combat_win_streak)
 
     def _set_combat_win_streak(self, value):
             if not self.player:
@@ -17,14 +25,12 @@ class FactionMixin:
     def _get_authority_standing(self):
             if not self.player:
                 return 0
-            if hasattr(self.player, "authority_standing"):
-                return int(getattr(self.player, "authority_standing", 0))
-            return int(getattr(self.player, "sector_reputation", 0))
+            return int(self.player.authority_standing)
 
     def _get_frontier_standing(self):
             if not self.player:
                 return 0
-            return int(getattr(self.player, "frontier_standing", 0))
+            return int(self.player.frontier_standing)
 
     def _set_standing(self, attr_name, value):
             if not self.player:
@@ -36,49 +42,42 @@ class FactionMixin:
             return int(clamped)
 
     def _adjust_authority_standing(self, delta):
-            return self._set_standing(
-                "authority_standing", self._get_authority_standing() + int(delta)
-            )
+            player = self.player
+            if not player:
+                return 0
+            value = int(player.authority_standing) + int(delta)
+            value = -100 if value < -100 else 100 if value > 100 else value
+            player.authority_standing = value
+            player.sector_reputation = value
+            return value
 
     def _adjust_frontier_standing(self, delta):
-            return self._set_standing(
-                "frontier_standing", self._get_frontier_standing() + int(delta)
-            )
+            player = self.player
+            if not player:
+                return 0
+            value = int(player.frontier_standing) + int(delta)
+            value = -100 if value < -100 else 100 if value > 100 else value
+            player.frontier_standing = value
+            return value
 
     def _adjust_sector_reputation(self, delta):
             return self._adjust_authority_standing(delta)
 
     def get_sector_standing_label(self):
             rep = self._get_authority_standing()
-            if rep >= 60:
-                return "HEROIC"
-            if rep >= 25:
-                return "TRUSTED"
-            if rep <= -60:
-                return "WANTED"
-            if rep <= -25:
-                return "SUSPECT"
-            return "NEUTRAL"
+            return _AUTHORITY_LABELS[bisect_right(_STANDING_CUTS, rep)]
 
     def get_authority_standing_label(self):
             return self.get_sector_standing_label()
 
     def get_frontier_standing_label(self):
             rep = self._get_frontier_standing()
-            if rep >= 60:
-                return "LEGENDARY"
-            if rep >= 25:
-                return "CONNECTED"
-            if rep <= -60:
-                return "OUTCAST"
-            if rep <= -25:
-                return "UNTRUSTED"
-            return "NEUTRAL"
+            return _FRONTIER_LABELS[bisect_right(_STANDING_CUTS, rep)]
 
     def _get_contract_chain_streak(self):
             if not self.player:
                 return 0
-            return int(getattr(self.player, "contract_chain_streak", 0))
+            return int(self.player.contract_chain_streak)
 
     def _set_contract_chain_streak(self, value):
             if not self.player:
@@ -87,46 +86,72 @@ class FactionMixin:
 
     def _get_contract_chain_bonus_factor(self):
             streak = self._get_contract_chain_streak()
-            per_completion = float(
-                self.config.get("contract_chain_bonus_per_completion")
-            )
-            cap = float(self.config.get("contract_chain_bonus_cap"))
-            return max(0.0, min(cap, streak * per_completion))
+            if streak == 0:
+                return 0.0
+            cfg = self._economy_cfg()
+            bonus = streak * cfg.contract_chain_bonus_per_completion
+            if bonus > cfg.contract_chain_bonus_cap:
+                bonus = cfg.contract_chain_bonus_cap
+            return bonus if bonus > 0.0 else 0.0
 
     def _update_law_heat_decay(self):
             now = time.time()
-            elapsed = max(0.0, now - float(getattr(self, "last_heat_decay_time", now)))
-            if elapsed < 3600:
+            # Cheap gate for the common case: nothing can decay before the deadline.
+            next_decay_at = getattr(self, "_next_heat_decay_at", None)
+            if next_decay_at is not None and now < next_decay_at:
                 return
 
-            decay_per_hour = max(0, int(self.config.get("law_heat_decay_per_hour", 3)))
-            ticks = int(elapsed // 3600)
-            if ticks <= 0 or decay_per_hour <= 0:
-                self.last_heat_decay_time = now
+            last_decay = float(getattr(self, "last_heat_decay_time", now))
+            elapsed = max(0.0, now - last_decay)
+            if elapsed < 3600:
+                self._next_heat_decay_at = last_decay + 3600
                 return
 
-            for planet_name in list(self.planet_heat.keys()):
-                value = max(0, int(self.planet_heat.get(planet_name, 0)) - (ticks * decay_per_hour))
-                if value <= 0:
-                    self.planet_heat.pop(planet_name, None)
-                else:
-                    self.planet_heat[planet_name] = int(min(100, value))
+            decay_per_hour = self._economy_cfg().law_heat_decay_per_hour
+            ticks = int(elapsed // 3600)
+            if ticks > 0 and decay_per_hour > 0:
+                decay = ticks * decay_per_hour
+                heat = self.planet_heat
+                cooled = []
+                for planet_name, level in heat.items():
+                    value = int(level) - decay
+                    if value <= 0:
+                        cooled.append(planet_name)
+                    else:
+                        heat[planet_name] = value if value < 100 else 100
+                for planet_name in cooled:
+                    del heat[planet_name]
 
             self.last_heat_decay_time = now
+            self._next_heat_decay_at = now + 3600
 
     def _get_law_heat(self, planet_name):
+            scope = getattr(self, "_request_scope", None)
+            if scope is not None:
+                cached = scope.get(("heat", planet_name))
+                if cached is not None:
+                    return cached
             self._update_law_heat_decay()
-            return int(max(0, min(100, self.planet_heat.get(planet_name, 0))))
+            # Writers keep entries as ints in 1..100 and drop cooled planets,
+            # so the stored value needs no clamping here.
+            heat = self.planet_heat.get(planet_name, 0)
+            if scope is not None:
+                scope[("heat", planet_name)] = heat
+            return heat
 
     def _adjust_law_heat(self, planet_name, delta):
+            scope = getattr(self, "_request_scope", None)
+            if scope is not None:
+                scope.pop(("heat", planet_name), None)
             self._update_law_heat_decay()
-            current = int(self.planet_heat.get(planet_name, 0))
-            updated = max(0, min(100, current + int(delta)))
+            updated = self.planet_heat.get(planet_name, 0) + int(delta)
             if updated <= 0:
                 self.planet_heat.pop(planet_name, None)
-            else:
-                self.planet_heat[planet_name] = int(updated)
-            return int(updated)
+                return 0
+            if updated > 100:
+                updated = 100
+            self.planet_heat[planet_name] = updated
+            return updated
 
     def bar_player(self, planet_name, duration_hours=None):
             """Bar player from a planet for a configurable number of hours."""
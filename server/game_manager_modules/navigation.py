@@ -1,25 +1,129 @@
+import json
 import math
+import re
 import time
-import random
+from bisect import bisect_right
+from collections import namedtuple
+from random import (
+    choice as _choice,
+    randint as _randint,
+    random as _random,
+    uniform as _uniform,
+)
+
+# Matches a non-blank password hash in a json.dumps payload, compact or not.
+# Escaped or oddly formatted values fall through to a real parse.
+_PROTECTED_SAVE_RE = re.compile(r'"password_hash": ?"\s*[^"\s\\]')
+
+# Warp ratios folded once: 5% hull across the ~1400px map, 1 fuel per 10px.
+_INTEGRITY_DMG_PER_DIST = 5.0 / 1400.0
+_FUEL_PER_DIST = 1.0 / 10.0
+
+# One commander row as the orbit scan sees it: only the fields the filter
+# reads. Matched targets load their full payload on demand.
+_OrbitScanEntry = namedtuple(
+    "_OrbitScanEntry", "stamp ref planet_key planet_name name last_save"
+)
+
+_TRAVEL_EVENT_TYPES = ("CACHE", "PIRATES", "DRIFT", "LEAK")
+_DRIFT_ITEMS = ("Titanium", "Fuel Cells", "Nanobot Repair Kits")
+_SIGNAL_TYPES = ("MARKET_TIP", "SMUGGLER_PSST", "FLAVOR", "SPAM")
+_SIGNAL_CDF = (0.05, 0.10, 0.15, 0.20)
+_CREW_TRAVEL_PRIORITY = ("engineer", "weapons")
+
+# Flavor lines are module-level tuples so event resolution does not rebuild
+# a list literal on every roll.
+_CACHE_SECURE_FLAVORS = (
+    "Cargo clamps lock with a metallic thunk as the cache reels in.",
+    "Your scanner crew cheers while encrypted chits decode on-screen.",
+    "Beacon lights fade behind you as the prize is stowed safely.",
+)
+
+_CACHE_BYPASS_FLAVORS = (
+    "You hold formation and keep engines in the green.",
+    "The cache drifts astern as you prioritize a clean arrival.",
+    "No detour taken; the lane stays stable and quiet.",
+)
+
+_DRIFT_SALVAGE_FLAVORS = (
+    "Mag-claws bite into the debris stream and pull it aboard.",
+    "A quick EVA drone pass secures the drifting container.",
+    "Recovered cargo thumps into bay storage as alarms clear.",
+)
+
+_DRIFT_IGNORE_FLAVORS = (
+    "You let the debris field pass and keep your vector true.",
+    "No recovery attempt; transit discipline remains tight.",
+    "The drift is logged for others as you press onward.",
+)
+
+_LEAK_NANO_FLAVORS = (
+    "Nanobots weave a silver lattice over the ruptured seam.",
+    "Pressure stabilizes as repair foam flashes into a hard seal.",
+    "Flow meters settle back into nominal bands.",
+)
+
+_LEAK_FIELD_FLAVORS = (
+    "You jury-rig a seal with cargo straps and stubborn optimism.",
+    "Temporary patch holds, but pressure still bleeds at the edges.",
+    "Manual bypass keeps the manifold alive just long enough.",
+)
+
+_LEAK_PUSH_FLAVORS = (
+    "You ride the leak and trust the remaining burn margin.",
+    "Warning klaxons fade as the tank level drops to compensate.",
+    "The ship shudders, but your course lock remains intact.",
+)
+
+_RAIDER_WIN_FLAVORS = (
+    "Tracer fire cuts a corridor and the raiders break formation.",
+    "Your attack run cracks their line; survivors scatter.",
+    "A final broadside sends the blockade spinning into darkness.",
+)
+
+_RAIDER_LOSS_FLAVORS = (
+    "You disengage under heavy fire and limp back to safe vector.",
+    "Counterfire shreds your approach, forcing a hard retreat.",
+    "The raiders rake your hull before you punch free.",
+)
+
+_RAIDER_TOLL_FLAVORS = (
+    "The pirate captain clears your lane with a mocking salute.",
+    "Encrypted payment accepted; the blockade opens just enough to pass.",
+    "You keep your hull intact and bank the grudge for later.",
+)
+
+# Headlines with a {planet} slot get a random planet only once chosen.
+_GNN_HEADLINES = (
+    "The Galactic Alliance has increased patrols around {planet}. Security level remains at high alert.",
+    "Economic boom reported in the {planet} system. Investors are flocking to local markets.",
+    "Rumors of a 'Phantom Ship' sighted near the asteroid belt. Pilots are advised to stay in well-lit lanes.",
+    "New record set for the Urth-Mastodrun run. 4.2 cycles. Can you beat it?",
+)
+
+_SPAM_SIGNAL_BODIES = (
+    "WE HAVE BEEN TRYING TO REACH YOU REGARDING YOUR SHIP'S EXTENDED WARRANTY.",
+    "EASY CREDITS! WORK FROM YOUR COCKPIT! JOIN THE SYNDICATE TODAY!",
+    "ENLARGE YOUR CARGO PODS WITH THIS ONE WEIRD TRICK. SCIENTISTS HATE HIM.",
+    "You have won 1,000,000 CR! Click here to claim your prize (requires 500 CR processing fee).",
+)
 
 
 class NavigationMixin:
     def _get_fuel_usage_multiplier(self):
-        try:
-            mult = float(self.config.get("fuel_usage_multiplier", 1.15))
-        except Exception:
-            mult = 1.15
-        # Global balance adjustment: -10% fuel usage across the board.
-        return max(0.0, mult * 0.90)
+        # Parsed once per config load (including the global -10% fuel
+        # adjustment) instead of on every burn.
+        return self._economy_cfg().fuel_usage_multiplier
 
     def _scale_and_round_fuel_usage(self, amount, minimum=0.0):
-        scaled = max(0.0, float(amount)) * self._get_fuel_usage_multiplier()
-        rounded = float(int(round(scaled)))
-        if scaled > 0.0:
-            rounded = max(1.0, rounded)
-        if minimum > 0.0:
-            rounded = max(float(minimum), rounded)
-        return rounded
+        amount = float(amount)
+        scaled = amount * self._get_fuel_usage_multiplier() if amount > 0.0 else 0.0
+        rounded = float(round(scaled))
+        # Any real burn costs at least 1 unit; an explicit minimum wins above that.
+        floor = 1.0 if scaled > 0.0 else 0.0
+        if minimum > floor:
+            floor = float(minimum)
+        return rounded if rounded >= floor else floor
 
     def _calculate_travel_fuel_cost(self, dist):
         burn_rate = (
@@ -27,7 +131,7 @@ class NavigationMixin:
             if hasattr(self.player.spaceship, "get_effective_fuel_burn_rate")
             else self.player.spaceship.fuel_burn_rate
         )
-        fuel_cost = (float(dist) / 10.0) * float(burn_rate)
+        fuel_cost = float(dist) * _FUEL_PER_DIST * float(burn_rate)
 
         if "engineer" in self.player.crew:
             engineer_bonus = max(0.0, min(0.95, self.player.crew["engineer"].get_bonus()))
@@ -46,15 +150,19 @@ class NavigationMixin:
             return None
         chance = float(self.config.get("travel_event_chance"))
         chance = max(0.0, min(1.0, chance))
-        if random.random() > chance:
+        roll = _random()
+        if roll > chance or chance <= 0.0:
             return None
 
-        event_type = random.choice(["CACHE", "PIRATES", "DRIFT", "LEAK"])
+        # Below the gate the roll is uniform on [0, chance], so rescaling it
+        # picks the event type with equal odds without a second draw.
+        count = len(_TRAVEL_EVENT_TYPES)
+        event_type = _TRAVEL_EVENT_TYPES[min(count - 1, int(roll / chance * count))]
         ship = self.player.spaceship
         planet_name = new_planet.name if new_planet else "UNKNOWN"
 
         if event_type == "CACHE":
-            reward = random.randint(120, 900)
+            reward = _randint(120, 900)
             return {
                 "type": "CACHE",
                 "title": "DERELICT CACHE DETECTED",
@@ -68,7 +176,7 @@ class NavigationMixin:
             }
 
         if event_type == "PIRATES":
-            loss = min(self.player.credits, random.randint(60, 550))
+            loss = min(self.player.credits, _randint(60, 550))
             return {
                 "type": "PIRATES",
                 "title": "RAIDER INTERCEPTION",
@@ -82,7 +190,7 @@ class NavigationMixin:
             }
 
         if event_type == "DRIFT":
-            item = random.choice(["Titanium", "Fuel Cells", "Nanobot Repair Kits"])
+            item = _choice(_DRIFT_ITEMS)
             return {
                 "type": "DRIFT",
                 "title": "SALVAGE DRIFT",
@@ -109,65 +217,40 @@ class NavigationMixin:
         }
 
     def resolve_travel_event_payload(self, event_payload, choice="AUTO"):
-        payload = dict(event_payload or {})
-        event_type = str(payload.get("type", "")).upper()
+        get = (event_payload or {}).get
+        event_type = str(get("type", "")).upper()
         selected = str(choice or "AUTO").upper()
 
         if event_type == "CACHE":
             if selected == "AUTO":
                 selected = "SECURE"
 
-            reward = max(0, int(payload.get("cache_reward", 0)))
             if selected == "SECURE":
+                reward = max(0, int(get("cache_reward", 0)))
                 self.player.credits += reward
-                flavor = random.choice(
-                    [
-                        "Cargo clamps lock with a metallic thunk as the cache reels in.",
-                        "Your scanner crew cheers while encrypted chits decode on-screen.",
-                        "Beacon lights fade behind you as the prize is stowed safely.",
-                    ]
-                )
+                flavor = _choice(_CACHE_SECURE_FLAVORS)
                 return f"DERELICT CACHE SECURED: +{reward:,} CR. {flavor}"
-            flavor = random.choice(
-                [
-                    "You hold formation and keep engines in the green.",
-                    "The cache drifts astern as you prioritize a clean arrival.",
-                    "No detour taken; the lane stays stable and quiet.",
-                ]
-            )
+            flavor = _choice(_CACHE_BYPASS_FLAVORS)
             return f"CACHE BYPASSED. ROUTE INTEGRITY MAINTAINED. {flavor}"
 
         if event_type == "DRIFT":
             if selected == "AUTO":
                 selected = "SALVAGE"
 
-            item = str(payload.get("drift_item", "Titanium"))
             if selected == "SALVAGE":
+                item = str(get("drift_item", "Titanium"))
                 self.player.inventory[item] = self.player.inventory.get(item, 0) + 1
                 self._adjust_frontier_standing(1)
-                flavor = random.choice(
-                    [
-                        "Mag-claws bite into the debris stream and pull it aboard.",
-                        "A quick EVA drone pass secures the drifting container.",
-                        "Recovered cargo thumps into bay storage as alarms clear.",
-                    ]
-                )
+                flavor = _choice(_DRIFT_SALVAGE_FLAVORS)
                 return f"SALVAGE DRIFT CAPTURED: +1 {item.upper()}. {flavor}"
-            flavor = random.choice(
-                [
-                    "You let the debris field pass and keep your vector true.",
-                    "No recovery attempt; transit discipline remains tight.",
-                    "The drift is logged for others as you press onward.",
-                ]
-            )
+            flavor = _choice(_DRIFT_IGNORE_FLAVORS)
             return f"DRIFT IGNORED. FORMATION HELD ON PRIMARY ROUTE. {flavor}"
 
         if event_type == "LEAK":
             if selected == "AUTO":
                 selected = "PATCH"
 
-            base_loss = max(0.0, float(payload.get("leak_loss", 1.0)))
-            full_loss = self._scale_and_round_fuel_usage(base_loss, minimum=1.0)
+            base_loss = max(0.0, float(get("leak_loss", 1.0)))
             if selected == "PATCH":
                 kit_qty = int(self.player.inventory.get("Nanobot Repair Kits", 0))
                 if kit_qty > 0:
@@ -181,13 +264,8 @@ class NavigationMixin:
                         0.0, self.player.spaceship.fuel - actual_loss
                     )
                     self._adjust_authority_standing(1)
-                    flavor = random.choice(
-                        [
-                            "Nanobots weave a silver lattice over the ruptured seam.",
-                            "Pressure stabilizes as repair foam flashes into a hard seal.",
-                            "Flow meters settle back into nominal bands.",
-                        ]
-                    )
+                    flavor = _choice(_LEAK_NANO_FLAVORS)
+                    full_loss = self._scale_and_round_fuel_usage(base_loss, minimum=1.0)
                     return (
                         f"LEAK PATCHED WITH NANOBOTS: -{actual_loss:.1f} FUEL "
                         f"(AVOIDED {max(0.0, full_loss - actual_loss):.1f}). {flavor}"
@@ -199,46 +277,25 @@ class NavigationMixin:
                 self.player.spaceship.fuel = max(
                     0.0, self.player.spaceship.fuel - improvised
                 )
-                flavor = random.choice(
-                    [
-                        "You jury-rig a seal with cargo straps and stubborn optimism.",
-                        "Temporary patch holds, but pressure still bleeds at the edges.",
-                        "Manual bypass keeps the manifold alive just long enough.",
-                    ]
-                )
+                flavor = _choice(_LEAK_FIELD_FLAVORS)
                 return (
                     f"FIELD PATCH APPLIED: -{improvised:.1f} FUEL "
                     f"(NANOBOT KIT UNAVAILABLE). {flavor}"
                 )
 
+            full_loss = self._scale_and_round_fuel_usage(base_loss, minimum=1.0)
             self.player.spaceship.fuel = max(0.0, self.player.spaceship.fuel - full_loss)
-            flavor = random.choice(
-                [
-                    "You ride the leak and trust the remaining burn margin.",
-                    "Warning klaxons fade as the tank level drops to compensate.",
-                    "The ship shudders, but your course lock remains intact.",
-                ]
-            )
+            flavor = _choice(_LEAK_PUSH_FLAVORS)
             return f"MICRO-LEAK PERSISTED: -{full_loss:.1f} FUEL. {flavor}"
 
         if event_type != "PIRATES":
-            return str(payload.get("arrival_line", ""))
-
-        pay_loss = max(0, int(payload.get("pay_loss", 0)))
-        inventory_before_raiders = dict(getattr(self.player, "inventory", {}) or {})
-
-        def _finalize_raider_result(result_line):
-            current_inventory = getattr(self.player, "inventory", None)
-            if not isinstance(current_inventory, dict):
-                self.player.inventory = {}
-                current_inventory = self.player.inventory
-            if (
-                inventory_before_raiders
-                and not current_inventory
-                and sum(inventory_before_raiders.values()) > 0
-            ):
-                self.player.inventory = dict(inventory_before_raiders)
-            return result_line
+            return str(get("arrival_line", ""))
+
+        pay_loss = max(0, int(get("pay_loss", 0)))
+        # Raider outcomes only touch credits, hull and standing (take_damage
+        # never reaches the hold), so the cargo needs no snapshot/restore.
+        if not isinstance(getattr(self.player, "inventory", None), dict):
+            self.player.inventory = {}
 
         if selected == "AUTO":
             selected = "PAY"
@@ -255,78 +312,76 @@ class NavigationMixin:
             player_power = (
                 (defenders * 1.35) + (shields * 0.28) + (18 * (1.0 + weapons_bonus))
             )
-            raider_power = random.uniform(25.0, 85.0)
+            raider_power = _uniform(25.0, 85.0)
 
             if player_power >= raider_power:
-                reward = random.randint(90, 420)
+                reward = _randint(90, 420)
                 self.player.credits += reward
                 self._adjust_frontier_standing(1)
-                if random.random() < 0.35:
+                if _random() < 0.35:
                     self._adjust_authority_standing(-1)
-                flavor = random.choice(
-                    [
-                        "Tracer fire cuts a corridor and the raiders break formation.",
-                        "Your attack run cracks their line; survivors scatter.",
-                        "A final broadside sends the blockade spinning into darkness.",
-                    ]
-                )
-                return _finalize_raider_result(
-                    f"RAIDER BLOCKADE BROKEN: +{reward:,} CR SALVAGED. {flavor}"
-                )
+                flavor = _choice(_RAIDER_WIN_FLAVORS)
+                return f"RAIDER BLOCKADE BROKEN: +{reward:,} CR SALVAGED. {flavor}"
 
-            loss = min(self.player.credits, max(pay_loss, random.randint(80, 620)))
+            loss = min(self.player.credits, max(pay_loss, _randint(80, 620)))
             self.player.credits -= loss
-            dmg = random.randint(4, 16)
+            dmg = _randint(4, 16)
             self.player.take_damage(dmg)
-            flavor = random.choice(
-                [
-                    "You disengage under heavy fire and limp back to safe vector.",
-                    "Counterfire shreds your approach, forcing a hard retreat.",
-                    "The raiders rake your hull before you punch free.",
-                ]
-            )
-            return _finalize_raider_result(
+            flavor = _choice(_RAIDER_LOSS_FLAVORS)
+            return (
                 f"FAILED TO BREAK BLOCKADE: -{loss:,} CR. "
                 f"HULL INTEGRITY -{dmg}% DURING WITHDRAWAL. {flavor}"
             )
 
         loss = min(self.player.credits, pay_loss)
         self.player.credits -= loss
-        flavor = random.choice(
-            [
-                "The pirate captain clears your lane with a mocking salute.",
-                "Encrypted payment accepted; the blockade opens just enough to pass.",
-                "You keep your hull intact and bank the grudge for later.",
-            ]
+        flavor = _choice(_RAIDER_TOLL_FLAVORS)
+        return f"RAIDER TOLL PAID: -{loss:,} CR. {flavor}"
+
+    def _get_smuggler_signal_planets(self):
+        """Smuggler hubs plus bribed planets, rebuilt only when bribes change."""
+        bribed = self.bribed_planets or set()
+        cached = getattr(self, "_smuggler_planets_cache", None)
+        if cached is not None and cached[0] is self.planets and cached[1] == bribed:
+            return cached[2]
+        planets = tuple(
+            p
+            for p in self.planets
+            if p.is_smuggler_hub or str(getattr(p, "planet_id", "")) in bribed
         )
-        return _finalize_raider_result(f"RAIDER TOLL PAID: -{loss:,} CR. {flavor}")
+        self._smuggler_planets_cache = (self.planets, frozenset(bribed), planets)
+        return planets
 
     def process_random_signals(self):
         """Occasionally injects flavor text or market tips into the player's inbox."""
+        # In-memory pacing only, so the monotonic clock is the right one.
+        now = time.monotonic()
         if not hasattr(self, "last_signal_check"):
-            self.last_signal_check = time.time()
+            self.last_signal_check = now
 
         # Check every 3 minutes (180s)
-        if time.time() - self.last_signal_check < 180:
+        if now - self.last_signal_check < 180:
             return
 
-        self.last_signal_check = time.time()
+        self.last_signal_check = now
 
-        # 20% chance to actually receive something
-        if random.random() > 0.20:
+        # 20% chance to actually receive something, split evenly by type;
+        # one draw against the cumulative cuts picks both.
+        pick = bisect_right(_SIGNAL_CDF, _random())
+        if pick >= len(_SIGNAL_TYPES):
             return
 
-        signal_type = random.choice(["MARKET_TIP", "SMUGGLER_PSST", "FLAVOR", "SPAM"])
+        signal_type = _SIGNAL_TYPES[pick]
 
         sender = "DEEP SPACE RELAY"
         subject = "ENCRYPTED SIGNAL"
         body = "..."
 
         if signal_type == "MARKET_TIP":
-            p = random.choice(self.planets)
+            p = _choice(self.planets)
             items = list(p.item_modifiers.keys())
             if items:
-                item = random.choice(items)
+                item = _choice(items)
                 mod = p.item_modifiers[item]
                 sender = "SECTOR DATA BURST"
                 subject = f"MKT REPORT: {p.name.upper()}"
@@ -339,18 +394,13 @@ class NavigationMixin:
 
         elif signal_type == "SMUGGLER_PSST":
             # Only if player has bribed someone or visited a hub
-            smug_planets = [
-                p
-                for p in self.planets
-                if p.is_smuggler_hub
-                or str(getattr(p, "planet_id", "")) in set(self.bribed_planets or set())
-            ]
+            smug_planets = self._get_smuggler_signal_planets()
             if smug_planets:
-                p = random.choice(smug_planets)
+                p = _choice(smug_planets)
                 sender = p.npc_name.upper()
                 subject = "A LITTLE SOMETHING"
                 if p.smuggling_inventory:
-                    item = random.choice(list(p.smuggling_inventory.keys()))
+                    item = _choice(list(p.smuggling_inventory.keys()))
                     body = f"Hey spacer. I just got a shipment of {item} in. Get to {p.name} before the Alliance snoops around. Mention my name for a 'discount'."
                 else:
                     body = f"Quiet day at {p.name}. Come by for a drink, I might have a job for you later."
@@ -360,36 +410,90 @@ class NavigationMixin:
         if signal_type == "FLAVOR":
             sender = "GNN NEWS WIRE"
             subject = "SECTOR HEADLINES"
-            options = [
-                f"The Galactic Alliance has increased patrols around {random.choice(self.planets).name}. Security level remains at high alert.",
-                f"Economic boom reported in the {random.choice(self.planets).name} system. Investors are flocking to local markets.",
-                "Rumors of a 'Phantom Ship' sighted near the asteroid belt. Pilots are advised to stay in well-lit lanes.",
-                "New record set for the Urth-Mastodrun run. 4.2 cycles. Can you beat it?",
-            ]
-            body = random.choice(options)
+            body = _choice(_GNN_HEADLINES)
+            if "{planet}" in body:
+                body = body.format(planet=_choice(self.planets).name)
 
         elif signal_type == "SPAM":
             sender = "UNKNOWN TRANSMITTER"
             subject = "UNSOLICITED LOG"
-            options = [
-                "WE HAVE BEEN TRYING TO REACH YOU REGARDING YOUR SHIP'S EXTENDED WARRANTY.",
-                "EASY CREDITS! WORK FROM YOUR COCKPIT! JOIN THE SYNDICATE TODAY!",
-                "ENLARGE YOUR CARGO PODS WITH THIS ONE WEIRD TRICK. SCIENTISTS HATE HIM.",
-                "You have won 1,000,000 CR! Click here to claim your prize (requires 500 CR processing fee).",
-            ]
-            body = random.choice(options)
+            body = _choice(_SPAM_SIGNAL_BODIES)
 
         if body != "...":
             self.send_message(self.player.name, subject, body, sender_name=sender)
 
-    def check_auto_refuel(self):
-        if self.player and self.player.spaceship.fuel < self.player.spaceship.max_fuel:
-            if self.player.spaceship.last_refuel_time > 0:
-                elapsed = time.time() - self.player.spaceship.last_refuel_time
-                # 4 hours = 14400 seconds
-                if elapsed >= 14400:
-                    self.player.spaceship.fuel = self.player.spaceship.max_fuel
-                    self.player.spaceship.last_refuel_time = 0
+    def check_auto_refuel(self, now=None):
+        if not self.player:
+            return
+        ship = self.player.spaceship
+        last_refuel = ship.last_refuel_time
+        if last_refuel <= 0 or ship.fuel >= ship.max_fuel:
+            return
+        # last_refuel_time is saved and shown to clients, so it stays on the
+        # wall clock. 4 hours = 14400 seconds.
+        if (time.time() if now is None else now) >= last_refuel + 14400:
+            ship.fuel = ship.max_fuel
+            ship.last_refuel_time = 0
+
+    def _get_orbit_scan_payloads(self):
+        """_OrbitScanEntry per commander row, keyed by characters rowid.
+
+        Fields the orbit filter needs are coerced once at parse time; entries
+        for password-protected rows carry no name, so they never match.
+
+        Every call reads the per-row stamps, so writes from any session or
+        code path show up immediately; rows whose (updated_at, version) stamp
+        moved are fetched in one query and re-parsed.
+        """
+        previous = getattr(self, "_orbit_scan_cache", None) or {}
+        cache = {}
+        changed = {}
+        for key, account_name, character_name, updated_at, version in (
+            self.store.iter_character_payload_stamps()
+        ):
+            # The integer rowid is the row's identity; a row re-created under a
+            # reused rowid carries a new updated_at, so it re-parses.
+            stamp = (updated_at, version)
+            hit = previous.get(key)
+            if hit is not None and hit.stamp == stamp:
+                cache[key] = hit
+            else:
+                changed[key] = (stamp, f"db://{account_name}/{character_name}")
+
+        for key, raw in self.store.get_character_payloads_json(changed).items():
+            stamp, ref = changed[key]
+            if _PROTECTED_SAVE_RE.search(raw):
+                # Password-protected saves never show up in orbit; skip parsing.
+                cache[key] = _OrbitScanEntry(stamp, "", "", "", "", 0.0)
+                continue
+            try:
+                data = json.loads(raw)
+            except Exception:
+                continue
+            if not isinstance(data, dict):
+                continue
+            if str(data.get("password_hash") or "").strip():
+                cache[key] = _OrbitScanEntry(stamp, "", "", "", "", 0.0)
+                continue
+
+            player_data = data.get("player")
+            if not isinstance(player_data, dict):
+                player_data = {}
+            try:
+                last_save = float(data.get("last_save_timestamp", 0) or 0)
+            except (TypeError, ValueError):
+                last_save = 0.0
+            cache[key] = _OrbitScanEntry(
+                stamp,
+                ref,
+                str(data.get("current_planet_id") or ""),
+                str(data.get("current_planet_name") or ""),
+                str(player_data.get("name", "")).strip(),
+                last_save,
+            )
+
+        self._orbit_scan_cache = cache
+        return cache
 
     def get_orbit_targets(self):
         """Finds other players and NPC ships at the current planet."""
@@ -401,7 +505,7 @@ class NavigationMixin:
                 targets.append({"type": "NPC", "obj": npc, "remark": npc.get_remark()})
 
                 # Chance of hostile NPC attacking immediately
-                if npc.personality == "hostile" and random.random() < 0.3:
+                if npc.personality == "hostile" and _random() < 0.3:
                     # We'll just return a flag or specific message
                     # But for now, let's keep it simple: the scan shows them.
                     pass
@@ -409,17 +513,21 @@ class NavigationMixin:
         # 2. Other Players (from SQLite first, then legacy save files)
         if getattr(self, "store", None) is not None:
             current_key = str(getattr(self.current_planet, "planet_id", ""))
-            for row in self.store.iter_all_characters():
-                data = row.get("payload") if isinstance(row, dict) else None
-                if not isinstance(data, dict):
-                    continue
-                if str(data.get("password_hash") or "").strip():
+            own_name = self.player.name
+            abandon_after = None
+            if self.config.get("enable_abandonment"):
+                abandon_after = float(self.config.get("abandonment_days")) * 86400
+                now = time.time()
+
+            matched = []
+            for key, entry in self._get_orbit_scan_payloads().items():
+                p_name = entry.name
+                if not p_name or p_name == own_name:
                     continue
 
-                save_key = str(data.get("current_planet_id") or "")
+                save_key = entry.planet_key
                 if not save_key:
-                    legacy_name = str(data.get("current_planet_name") or "")
-                    legacy_planet = self.get_planet_by_name(legacy_name)
+                    legacy_planet = self.get_planet_by_name(entry.planet_name)
                     save_key = (
                         str(getattr(legacy_planet, "planet_id", ""))
                         if legacy_planet
@@ -428,32 +536,29 @@ class NavigationMixin:
                 if save_key != current_key:
                     continue
 
-                player_data = (
-                    data.get("player") if isinstance(data.get("player"), dict) else {}
+                is_abandoned = (
+                    abandon_after is not None
+                    and entry.last_save > 0
+                    and (now - entry.last_save) >= abandon_after
                 )
-                p_name = str(player_data.get("name", "")).strip()
-                if not p_name or p_name == self.player.name:
-                    continue
-
-                is_abandoned = False
-                if self.config.get("enable_abandonment"):
-                    last_save = float(data.get("last_save_timestamp", 0) or 0)
-                    days_limit = self.config.get("abandonment_days")
-                    seconds_limit = float(days_limit) * 86400
-                    if last_save > 0 and (time.time() - last_save) >= seconds_limit:
-                        is_abandoned = True
-
-                account_name = str(row.get("account_name") or "").strip()
-                character_name = str(row.get("character_name") or "").strip()
-                ref = f"db://{account_name}/{character_name}"
+                matched.append((key, entry, is_abandoned))
 
+            # Only commanders actually in orbit need their full save.
+            payloads = self.store.get_character_payloads_json(
+                key for key, _entry, _abandoned in matched
+            )
+            for key, entry, is_abandoned in matched:
+                try:
+                    raw_data = json.loads(payloads[key])
+                except Exception:
+                    continue
                 targets.append(
                     {
                         "type": "PLAYER",
-                        "name": p_name,
-                        "raw_data": data,
+                        "name": entry.name,
+                        "raw_data": raw_data,
                         "is_abandoned": is_abandoned,
-                        "save_path": ref,
+                        "save_path": entry.ref,
                     }
                 )
 
@@ -501,23 +606,15 @@ class NavigationMixin:
             try:
                 _, _, remainder = path.partition("db://")
                 account_name, _, character_name = remainder.partition("/")
-                data = self.store.get_character_payload(account_name, character_name)
-                if "player" not in data:
-                    return False, "Invalid target player data."
-
-                target_inventory = data["player"].get("inventory")
-                if not isinstance(target_inventory, dict):
-                    target_inventory = {}
-
-                target_inventory[item] = int(target_inventory.get(item, 0)) + amount
-                data["player"]["inventory"] = target_inventory
-
-                self.store.upsert_character_payload(
-                    account_name,
-                    character_name,
-                    data,
-                    display_name=str(data.get("player", {}).get("name") or character_name),
-                )
+                with self.store.edit_character_payload(account_name, character_name) as data:
+                    target_player = data.get("player")
+                    if not isinstance(target_player, dict):
+                        return False, "Invalid target player data."
+
+                    target_inventory = target_player.get("inventory")
+                    if not isinstance(target_inventory, dict):
+                        target_inventory = target_player["inventory"] = {}
+                    target_inventory[item] = int(target_inventory.get(item, 0)) + amount
             except Exception:
                 return False, "Failed to transfer cargo to target ship."
 
@@ -535,6 +632,17 @@ class NavigationMixin:
 
         return True, f"TRANSFERRED {amount}x {item} TO {target_name.upper()}."
 
+    def _get_ship_by_model(self):
+        """Catalog ship per model name (first entry wins), rebuilt on reload."""
+        cached = getattr(self, "_ship_by_model_cache", None)
+        if cached is not None and cached[0] is self.spaceships:
+            return cached[1]
+        by_model = {}
+        for ship in self.spaceships:
+            by_model.setdefault(ship.model, ship)
+        self._ship_by_model_cache = (self.spaceships, by_model)
+        return by_model
+
     def claim_abandoned_ship(self, target_name, action, extras=None):
         """Handle interactions with abandoned player ships."""
         path = self._find_commander_save_path_by_name(target_name)
@@ -545,44 +653,41 @@ class NavigationMixin:
 
         _, _, remainder = path.partition("db://")
         account_name, _, character_name = remainder.partition("/")
-        data = self.store.get_character_payload(account_name, character_name)
-        if not isinstance(data, dict):
-            return False, "Ship no longer exists."
-        ship_data = data["player"]["spaceship"]
 
         if action == "LOOT":
-            # Just take cargo and credits
-            loot_credits = data["player"].get("credits", 0)
-            loot_items = data["player"].get("inventory", {})
+            # Just take cargo and credits, wiping them from the husk in the
+            # same read-modify-write so the ship stays behind empty.
+            with self.store.edit_character_payload(account_name, character_name) as data:
+                if not isinstance(data, dict):
+                    return False, "Ship no longer exists."
+                loot_credits = data["player"].get("credits", 0)
+                loot_items = data["player"].get("inventory", {})
+                data["player"]["credits"] = 0
+                data["player"]["inventory"] = {}
+
             self.player.credits += loot_credits
             for item, qty in loot_items.items():
                 self.player.inventory[item] = self.player.inventory.get(item, 0) + qty
-
-            # Wipe the abandoned player's assets but keep the ship (as an empty husk)
-            data["player"]["credits"] = 0
-            data["player"]["inventory"] = {}
-            self.store.upsert_character_payload(
-                account_name,
-                character_name,
-                data,
-                display_name=str(data.get("player", {}).get("name") or character_name),
-            )
             return (
                 True,
                 f"Looted {loot_credits} credits and cargo from {target_name}'s vessel.",
             )
 
-        elif action == "DESTROY":
+        data = self.store.get_character_payload(account_name, character_name)
+        if not isinstance(data, dict):
+            return False, "Ship no longer exists."
+        ship_data = data["player"]["spaceship"]
+
+        if action == "DESTROY":
             self.store.delete_character(account_name, character_name)
             return True, f"Target vessel {target_name} has been vaporized."
 
         elif action == "SELL":
             # Sell based on model cost
             ship_val = 1000  # Default
-            for s in self.spaceships:
-                if s.model == ship_data["model"]:
-                    ship_val = int(s.cost * 0.7)  # 70% resale
-                    break
+            template = self._get_ship_by_model().get(ship_data["model"])
+            if template is not None:
+                ship_val = int(template.cost * 0.7)  # 70% resale
             self.player.credits += ship_val
             self.store.delete_character(account_name, character_name)
             return (
@@ -592,22 +697,18 @@ class NavigationMixin:
 
         elif action == "KEEP":
             # Transfer EVERYTHING to the new ship
+            ships_by_model = self._get_ship_by_model()
             old_ship_val = 0
-            for s in self.spaceships:
-                if s.model == self.player.spaceship.model:
-                    old_ship_val = int(s.calculate_value() * 0.7)
-                    break
+            old_template = ships_by_model.get(self.player.spaceship.model)
+            if old_template is not None:
+                old_ship_val = int(old_template.calculate_value() * 0.7)
 
             # 1. Sell old ship
             self.player.credits += old_ship_val
 
             # 2. Update player spaceship to abandoned one
             # Find template for base stats
-            template = self.spaceships[0]
-            for s in self.spaceships:
-                if s.model == ship_data["model"]:
-                    template = s
-                    break
+            template = ships_by_model.get(ship_data["model"], self.spaceships[0])
 
             from classes import Spaceship
 
@@ -663,14 +764,10 @@ class NavigationMixin:
             # Implementation: Overwrite recipient's ship but they get it next login
             _, _, r_remainder = r_path.partition("db://")
             r_account_name, _, r_character_name = r_remainder.partition("/")
-            r_data = self.store.get_character_payload(r_account_name, r_character_name)
-            r_data["player"]["spaceship"] = ship_data
-            self.store.upsert_character_payload(
-                r_account_name,
-                r_character_name,
-                r_data,
-                display_name=str(r_data.get("player", {}).get("name") or r_character_name),
-            )
+            with self.store.edit_character_payload(
+                r_account_name, r_character_name
+            ) as r_data:
+                r_data["player"]["spaceship"] = ship_data
 
             # Notify recipient
             self.send_message(
@@ -684,6 +781,22 @@ class NavigationMixin:
 
         return False, "Unknown action."
 
+    def _post_arrival_update(self, new_planet):
+        """Per-arrival bookkeeping for ``new_planet`` in one call.
+
+        Counts the port visit, rolls the planet event and the spotlight deal
+        (in that RNG order) and returns ``(rolled_event, spotlight_line)``.
+        """
+        player = self.player
+        if not hasattr(player, "port_visits"):
+            player.port_visits = {}
+        port_visits = player.port_visits
+        pname = new_planet.name
+        port_visits[pname] = port_visits.get(pname, 0) + 1
+
+        rolled_event = self._maybe_roll_planet_event(new_planet)
+        return rolled_event, self._set_port_spotlight_deal(new_planet)
+
     def travel_to_planet(
         self,
         planet_index,
@@ -691,96 +804,102 @@ class NavigationMixin:
         travel_event_message=None,
     ):
         if 0 <= planet_index < len(self.planets):
-            self._load_shared_planet_states()
             new_planet = self.planets[planet_index]
 
             is_barred, bar_msg = self.check_barred(new_planet.name)
             if is_barred:
                 return False, f"NAV COMP LOCKED: {bar_msg}"
 
-            dist = math.sqrt(
-                (new_planet.x - self.current_planet.x) ** 2
-                + (new_planet.y - self.current_planet.y) ** 2
+            dist = math.hypot(
+                new_planet.x - self.current_planet.x,
+                new_planet.y - self.current_planet.y,
             )
 
             fuel_cost = self._calculate_travel_fuel_cost(dist)
             fuel_cost *= max(0.25, float(self.config.get("jump_fuel_use_base", 1.0)))
 
-            if self.player.spaceship.fuel >= fuel_cost:
+            player = self.player
+            ship = player.spaceship
+            if ship.fuel >= fuel_cost:
+                # Refused jumps never touch shared planet state, so only a
+                # jump that is going ahead pays for the store read.
+                self._load_shared_planet_states()
                 fuel_ok, fuel_note = self.consume_fuel(
-                    getattr(self.player.spaceship, "model", None), fuel_cost
+                    getattr(ship, "model", None), fuel_cost
                 )
                 if not fuel_ok:
                     return False, "INSUFFICIENT FUEL FOR WARP JUMP."
 
                 # Integrity degradation: 1-5% based on travel distance
                 # Max distance across map is ~1400 pixels
-                dmg = max(1.0, (dist / 1400.0) * 5.0)
-                self.player.take_damage(dmg)
+                dmg = dist * _INTEGRITY_DMG_PER_DIST
+                if dmg < 1.0:
+                    dmg = 1.0
+                player.take_damage(dmg)
 
                 self.current_planet = new_planet
-                setattr(self.player, "is_docked", False)
+                setattr(player, "is_docked", False)
                 self._apply_crew_activity("travel", specialty="engineer")
 
-                if not hasattr(self.player, "port_visits"):
-                    self.player.port_visits = {}
-                self.player.port_visits[new_planet.name] = (
-                    int(self.player.port_visits.get(new_planet.name, 0)) + 1
-                )
-
-                rolled_event = self._maybe_roll_planet_event(new_planet)
-                self._set_port_spotlight_deal(new_planet)
+                rolled_event, spotlight_line = self._post_arrival_update(new_planet)
 
-                # If fuel is now empty, start the recharge timer
-                if self.player.spaceship.fuel <= 0:
-                    self.player.spaceship.last_refuel_time = time.time()
+                # If fuel is now empty, start the recharge timer. Wall clock on
+                # purpose: check_auto_refuel compares it against saved values.
+                if ship.fuel <= 0:
+                    ship.last_refuel_time = time.time()
 
-                msg = f"ENGAGED WARP. CONSUMED {fuel_cost:.1f} FUEL. SHIP INTEGRITY -{dmg:.1f}%."
-                msg += " YOU ARE NOW IN ORBIT. REQUEST DOCKING TO ACCESS PLANET SERVICES."
+                parts = [
+                    f"ENGAGED WARP. CONSUMED {fuel_cost:.1f} FUEL. SHIP INTEGRITY -{dmg:.1f}%."
+                    " YOU ARE NOW IN ORBIT. REQUEST DOCKING TO ACCESS PLANET SERVICES."
+                ]
 
                 event_msg = ""
                 if travel_event_message:
-                    event_msg = str(travel_event_message)
-                elif not bool(skip_travel_event):
+                    event_msg = (
+                        travel_event_message
+                        if isinstance(travel_event_message, str)
+                        else str(travel_event_message)
+                    )
+                elif not skip_travel_event:
                     event_msg = self._roll_travel_event(new_planet, dist)
                 if event_msg:
-                    msg += f"\n{event_msg}"
+                    parts.append(event_msg)
 
                 c_ok, c_msg = self._generate_trade_contract()
                 if c_ok and c_msg:
-                    msg += f"\n{c_msg}"
+                    parts.append(c_msg)
 
-                deal = self.get_current_port_spotlight_deal()
-                if deal:
-                    msg += (
-                        f"\nPORT SPOTLIGHT: {deal['item'].upper()} -{int(deal['discount_pct'])}% "
-                        f"({int(deal['quantity'])} UNIT(S))."
-                    )
+                if spotlight_line:
+                    parts.append(spotlight_line)
 
                 if rolled_event:
-                    msg += (
-                        f"\nPLANET EVENT: {rolled_event.get('label', 'Sector Disturbance').upper()} - "
+                    parts.append(
+                        f"PLANET EVENT: {rolled_event.get('label', 'Sector Disturbance').upper()} - "
                         f"{rolled_event.get('desc', 'Local market conditions shifted.')}"
                     )
 
                 prod_ok, prod_msg = self.produce_resources()
                 if prod_ok and prod_msg:
-                    msg += f"\n{prod_msg}"
+                    parts.append(prod_msg)
 
-                if fuel_note and "LOW FUEL" in str(fuel_note).upper():
-                    msg += f"\n{str(fuel_note).upper()}"
+                if fuel_note:
+                    fuel_note = str(fuel_note).upper()
+                    if "LOW FUEL" in fuel_note:
+                        parts.append(fuel_note)
 
                 # Add crew insight
-                if "engineer" in self.player.crew:
-                    msg += f"\n\"{self.player.crew['engineer'].get_remark('travel')}\""
-                elif "weapons" in self.player.crew:
-                    msg += f"\n\"{self.player.crew['weapons'].get_remark('travel')}\""
-
-                return True, msg
+                crew = player.crew
+                for role in _CREW_TRAVEL_PRIORITY:
+                    member = crew.get(role)
+                    if member is not None:
+                        parts.append(f"\"{member.get_remark('travel')}\"")
+                        break
+
+                return True, "\n".join(parts)
             else:
                 return (
                     False,
-                    f"Insufficient fuel! Need {fuel_cost:.1f}, have {self.player.spaceship.fuel:.1f}.",
+                    f"Insufficient fuel! Need {fuel_cost:.1f}, have {ship.fuel:.1f}.",
                 )
         return False, "Target coordinates invalid."
 
@@ -796,9 +915,14 @@ class NavigationMixin:
             return False, f"DOCKING DENIED: {bar_msg}"
 
         fee = self.get_docking_fee(self.current_planet, self.player.spaceship)
-        visits = int(getattr(self.player, "port_visits", {}).get(self.current_planet.name, 0))
-        if visits >= 5:
-            fee = int(round(fee * 0.9))
+        if fee > 0:
+            visits = getattr(self.player, "port_visits", {}).get(self.current_planet.name, 0)
+            if visits >= 5:
+                # 10% loyalty discount, rounded half-to-even like round(fee * 0.9)
+                # but without leaving integer arithmetic.
+                fee, rem = divmod(fee * 9, 10)
+                if rem > 5 or (rem == 5 and fee & 1):
+                    fee += 1
 
         if int(self.player.credits) < int(fee):
             shortfall = int(fee) - int(self.player.credits)
@@ -2,8 +2,23 @@ import time
 import json
 import os
 from datetime import datetime, timedelta
+from operator import attrgetter
 from classes import Player, Spaceship
 
+# One C-level fetch of every persisted planet field, in payload order.
+_PLANET_STATE_FIELDS = attrgetter(
+    "planet_id",
+    "owner",
+    "defenders",
+    "shields",
+    "credit_balance",
+    "credits_initialized",
+    "last_credit_interest_time",
+    "max_shields",
+    "max_defenders",
+    "last_defense_regen_time",
+)
+
 
 class PersistenceMixin:
     UNIVERSE_SCHEMA_VERSION = 2
@@ -35,13 +50,25 @@ class PersistenceMixin:
         if getattr(self, "store", None) is None:
             return self._default_winner_board_state()
 
-        payload = self.store.get_kv("shared", "winner_board", default=None)
-        if not isinstance(payload, dict):
-            return self._default_winner_board_state()
-        state = self._default_winner_board_state()
-        state.update(payload)
-        history = state.get("history", [])
-        state["history"] = history if isinstance(history, list) else []
+        # The board is read on every snapshot and reset check but rarely
+        # written; keep the parsed state until the stored text changes.
+        raw = self.store.get_kv_raw("shared", "winner_board")
+        cached = getattr(self, "_winner_board_cache", None)
+        if cached is None or cached[0] != raw:
+            try:
+                payload = json.loads(raw) if raw is not None else None
+            except Exception:
+                payload = None
+            state = self._default_winner_board_state()
+            if isinstance(payload, dict):
+                state.update(payload)
+                history = state.get("history", [])
+                state["history"] = history if isinstance(history, list) else []
+            cached = self._winner_board_cache = (raw, state)
+
+        # Callers only replace top-level keys, so a shallow copy is enough.
+        state = dict(cached[1])
+        state["history"] = list(state["history"])
         return state
 
     def _save_winner_board_state(self, state):
@@ -54,66 +81,52 @@ class PersistenceMixin:
             return False
 
     def _build_faction_rankings(self, commanders):
-        authority_sorted = sorted(
-            commanders,
-            key=lambda row: (
+        # Coerce each row once; the sorts then compare prebuilt key tuples.
+        # Sorting indices keeps the stable tie order of the row list.
+        rows = [
+            (
+                str(row.get("name", "")),
                 int(row.get("authority", 0)),
-                int(row.get("owned_planets", 0)),
-                int(row.get("total_credits", 0)),
-            ),
-            reverse=True,
-        )
-        frontier_sorted = sorted(
-            commanders,
-            key=lambda row: (
                 int(row.get("frontier", 0)),
                 int(row.get("owned_planets", 0)),
                 int(row.get("total_credits", 0)),
-            ),
-            reverse=True,
+            )
+            for row in commanders
+        ]
+        authority_keys = [(auth, owned, credits) for _, auth, _, owned, credits in rows]
+        frontier_keys = [(front, owned, credits) for _, _, front, owned, credits in rows]
+        authority_order = sorted(
+            range(len(rows)), key=authority_keys.__getitem__, reverse=True
+        )
+        frontier_order = sorted(
+            range(len(rows)), key=frontier_keys.__getitem__, reverse=True
         )
 
-        authority_ranking = []
-        frontier_ranking = []
-        for idx, row in enumerate(authority_sorted, start=1):
-            authority_ranking.append(
-                {
-                    "rank": idx,
-                    "name": str(row.get("name", "")),
-                    "value": int(row.get("authority", 0)),
-                }
-            )
-        for idx, row in enumerate(frontier_sorted, start=1):
-            frontier_ranking.append(
-                {
-                    "rank": idx,
-                    "name": str(row.get("name", "")),
-                    "value": int(row.get("frontier", 0)),
-                }
-            )
+        authority_ranking = [
+            {"rank": idx, "name": rows[i][0], "value": rows[i][1]}
+            for idx, i in enumerate(authority_order, start=1)
+        ]
+        frontier_ranking = [
+            {"rank": idx, "name": rows[i][0], "value": rows[i][2]}
+            for idx, i in enumerate(frontier_order, start=1)
+        ]
 
         return {"authority": authority_ranking, "frontier": frontier_ranking}
 
-    def _compute_winner_board_snapshot(self):
-        planet_state_map = self._collect_planet_states()
-        total_planets = max(1, len(self.planets))
+    def _compute_winner_board_snapshot(self, sort_commanders=True):
+        """Commander standings, faction rankings and the winner state.
 
-        by_owner = {}
-        for planet_name, state in (planet_state_map or {}).items():
-            owner = str(state.get("owner") or "").strip()
-            if not owner:
-                continue
-            owner_key = owner.lower()
-            by_owner.setdefault(owner_key, {"owner_name": owner, "planets": []})
-            by_owner[owner_key]["planets"].append((planet_name, state))
+        ``sort_commanders=False`` leaves the commander rows in save order for
+        callers that only filter them; faction rankings are unaffected.
+        """
+        total_planets = max(1, len(self.planets))
+        by_owner = self._planet_holdings_by_owner()
 
         commanders = []
+        commander_names = []
         seen = set()
         total_strategic_resources = 0
-        for path in self._iter_commander_save_paths():
-            data = self._load_commander_payload_by_ref(path)
-            if not isinstance(data, dict):
-                continue
+        for path, data in self._iter_commander_data():
             p_data = data.get("player") if isinstance(data.get("player"), dict) else {}
             name = str(p_data.get("name") or "").strip()
             if not name:
@@ -122,14 +135,11 @@ class PersistenceMixin:
             if key in seen:
                 continue
             seen.add(key)
+            commander_names.append(name)
 
-            owned_records = by_owner.get(key, {}).get("planets", [])
-            owned_planets = len(owned_records)
+            owned_planets, colony_credits = by_owner.get(key, (0, 0))
             personal_credits = int(p_data.get("credits", 0) or 0)
             bank_balance = int(p_data.get("bank_balance", 0) or 0)
-            colony_credits = sum(
-                int((st or {}).get("credit_balance", 0) or 0) for _, st in owned_records
-            )
             total_credits = personal_credits + bank_balance + colony_credits
 
             authority = int(
@@ -193,14 +203,15 @@ class PersistenceMixin:
             own_total = int(row.get("resource_total", 0) or 0)
             row["resource_share_pct"] = round((own_total / float(strategic_total)) * 100.0, 2)
 
-        commanders.sort(
-            key=lambda row: (
-                int(row.get("owned_planets", 0)),
-                float(row.get("planet_ownership_pct", 0.0)),
-                int(row.get("total_credits", 0)),
-            ),
-            reverse=True,
-        )
+        if sort_commanders:
+            commanders.sort(
+                key=lambda row: (
+                    int(row.get("owned_planets", 0)),
+                    float(row.get("planet_ownership_pct", 0.0)),
+                    int(row.get("total_credits", 0)),
+                ),
+                reverse=True,
+            )
 
         rankings = self._build_faction_rankings(commanders)
         winner_state = self._load_winner_board_state()
@@ -208,10 +219,30 @@ class PersistenceMixin:
             "total_planets": int(total_planets),
             "total_strategic_resources": int(total_strategic_resources),
             "commanders": commanders,
+            "commander_names": commander_names,
             "faction_rankings": rankings,
             "winner_state": winner_state,
         }
 
+    def _planet_holdings_by_owner(self):
+        """Lowercased owner -> (planet count, summed colony credits).
+
+        Reads only the two fields the board needs straight off the planets
+        instead of building the full persisted state map.
+        """
+        holdings = {}
+        for planet in self.planets:
+            owner = str(planet.owner or "").strip()
+            if not owner:
+                continue
+            owner_key = owner.lower()
+            count, credits = holdings.get(owner_key, (0, 0))
+            holdings[owner_key] = (
+                count + 1,
+                credits + int(getattr(planet, "credit_balance", 0) or 0),
+            )
+        return holdings
+
     def _next_reset_timestamp(self, days_from_now):
         days = max(0, int(days_from_now or 0))
         now_dt = datetime.now()
@@ -226,14 +257,18 @@ class PersistenceMixin:
         )
         return float(target_dt.timestamp())
 
-    def _broadcast_system_mail(self, subject, body, sender_name="GALACTIC COUNCIL"):
-        recipients = []
-        for path in self._iter_commander_save_paths():
-            data = self._load_commander_payload_by_ref(path)
-            p_data = data.get("player") if isinstance(data.get("player"), dict) else {}
-            name = str(p_data.get("name") or "").strip()
-            if name:
-                recipients.append(name)
+    def _broadcast_system_mail(
+        self, subject, body, sender_name="GALACTIC COUNCIL", recipients=None
+    ):
+        """Mail every commander, or just ``recipients`` when the caller has
+        already walked the saves (e.g. a winner board snapshot)."""
+        if recipients is None:
+            recipients = []
+            for _path, data in self._iter_commander_data():
+                p_data = data.get("player") if isinstance(data.get("player"), dict) else {}
+                name = str(p_data.get("name") or "").strip()
+                if name:
+                    recipients.append(name)
 
         sent = 0
         seen = set()
@@ -253,15 +288,19 @@ class PersistenceMixin:
         return sent
 
     def _evaluate_and_record_winner(self):
-        snapshot = self._compute_winner_board_snapshot()
+        # Runs on every save; once a winner is declared there is nothing to
+        # evaluate until the reset, so skip the commander walk entirely.
+        winner_state = self._load_winner_board_state()
+        if winner_state.get("current_winner"):
+            return winner_state.get("current_winner")
+
+        # Only a filter and max() follow, and max() picks the same row from
+        # save order as from the sorted leaderboard, so skip the sort.
+        snapshot = self._compute_winner_board_snapshot(sort_commanders=False)
         commanders = list(snapshot.get("commanders", []) or [])
         if not commanders:
             return None
 
-        winner_state = dict(snapshot.get("winner_state") or {})
-        if winner_state.get("current_winner"):
-            return winner_state.get("current_winner")
-
         min_planet_pct = float(self.config.get("victory_planet_ownership_pct"))
         authority_min = int(self.config.get("victory_authority_min"))
         authority_max = int(self.config.get("victory_authority_max"))
@@ -270,24 +309,23 @@ class PersistenceMixin:
         min_resource_share = float(self.config.get("victory_resource_share_pct", 0) or 0)
         min_credit_hoard = int(self.config.get("victory_credit_hoard", 0) or 0)
 
-        candidates = []
-        for row in commanders:
-            pct = float(row.get("planet_ownership_pct", 0.0))
-            authority = int(row.get("authority", 0))
-            frontier = int(row.get("frontier", 0))
-            if pct < min_planet_pct:
-                continue
-            if not (authority_min <= authority <= authority_max):
-                continue
-            if not (frontier_min <= frontier <= frontier_max):
-                continue
-            if min_resource_share > 0.0:
-                if float(row.get("resource_share_pct", 0.0) or 0.0) < min_resource_share:
-                    continue
-            if min_credit_hoard > 0:
-                if int(row.get("total_credits", 0) or 0) < min_credit_hoard:
-                    continue
-            candidates.append(row)
+        # Snapshot rows are built above with typed values, so the thresholds
+        # compare them directly; the optional gates fall away when disabled.
+        candidates = [
+            row
+            for row in commanders
+            if row["planet_ownership_pct"] >= min_planet_pct
+            and authority_min <= row["authority"] <= authority_max
+            and frontier_min <= row["frontier"] <= frontier_max
+        ]
+        if min_resource_share > 0.0:
+            candidates = [
+                row for row in candidates if row["resource_share_pct"] >= min_resource_share
+            ]
+        if min_credit_hoard > 0:
+            candidates = [
+                row for row in candidates if row["total_credits"] >= min_credit_hoard
+            ]
 
         if not candidates:
             return None
@@ -303,24 +341,17 @@ class PersistenceMixin:
         )
 
         rankings = snapshot.get("faction_rankings", {})
-        authority_rank = next(
-            (
-                int(entry.get("rank", 0))
-                for entry in list(rankings.get("authority", []) or [])
-                if str(entry.get("name", "")).lower()
-                == str(winner.get("name", "")).lower()
-            ),
-            0,
-        )
-        frontier_rank = next(
-            (
-                int(entry.get("rank", 0))
-                for entry in list(rankings.get("frontier", []) or [])
-                if str(entry.get("name", "")).lower()
-                == str(winner.get("name", "")).lower()
-            ),
-            0,
-        )
+        winner_name_lc = str(winner.get("name", "")).lower()
+        faction_ranks = []
+        for faction in ("authority", "frontier"):
+            # First entry per lowercased name wins, as with a linear scan.
+            rank_by_name = {}
+            for entry in rankings.get(faction, []) or []:
+                rank_by_name.setdefault(
+                    str(entry.get("name", "")).lower(), entry.get("rank", 0)
+                )
+            faction_ranks.append(int(rank_by_name.get(winner_name_lc, 0)))
+        authority_rank, frontier_rank = faction_ranks
 
         reset_days = int(self.config.get("victory_reset_days"))
         reset_ts = self._next_reset_timestamp(reset_days)
@@ -365,7 +396,9 @@ class PersistenceMixin:
             f"Total credits: {winner_record['total_credits']:,}. "
             f"Universe reset is scheduled for {reset_dt_text}."
         )
-        self._broadcast_system_mail(subject, body)
+        self._broadcast_system_mail(
+            subject, body, recipients=snapshot.get("commander_names")
+        )
         self._append_galactic_news(
             title="Campaign Winner Declared",
             body=body,
@@ -497,6 +530,40 @@ class PersistenceMixin:
         }
 
     def _collect_planet_states(self):
+        states = {}
+        for p in self.planets:
+            try:
+                (
+                    planet_id,
+                    owner,
+                    defenders,
+                    shields,
+                    credit_balance,
+                    credits_initialized,
+                    last_credit_interest_time,
+                    max_shields,
+                    max_defenders,
+                    last_defense_regen_time,
+                ) = _PLANET_STATE_FIELDS(p)
+            except AttributeError:
+                # Planet-like objects missing optional fields keep the
+                # defaulted per-field reads.
+                states.update(self._collect_planet_state_fallback(p))
+                continue
+            states[str(planet_id)] = {
+                "owner": owner,
+                "defenders": int(defenders),
+                "shields": int(shields),
+                "credit_balance": int(credit_balance),
+                "credits_initialized": bool(credits_initialized),
+                "last_credit_interest_time": float(last_credit_interest_time),
+                "max_shields": int(max_shields),
+                "max_defenders": int(max_defenders),
+                "last_defense_regen_time": float(last_defense_regen_time),
+            }
+        return states
+
+    def _collect_planet_state_fallback(self, p):
         return {
             str(getattr(p, "planet_id", 0)): {
                 "owner": p.owner,
@@ -513,7 +580,6 @@ class PersistenceMixin:
                     getattr(p, "last_defense_regen_time", 0)
                 ),
             }
-            for p in self.planets
         }
 
     def _apply_planet_states(self, planet_states, apply_ownership=True):
@@ -642,9 +708,18 @@ class PersistenceMixin:
 
         now = float(time.time())
         keep_after = now - (86400 * int(self.galactic_news_retention_days))
-        items = [
-            item for item in items if float(item.get("timestamp", 0)) >= keep_after
-        ]
+        # Assumes entries sit in wall-clock order: every session appends
+        # time.time() to the end of the shared list, so expired entries form a
+        # prefix. A clock step between servers can strand an expired entry
+        # behind a newer one; the 1200 cap drops it eventually and
+        # get_unseen_galactic_news filters by the retention window on read.
+        expired = 0
+        for item in items:
+            if float(item.get("timestamp", 0)) >= keep_after:
+                break
+            expired += 1
+        if expired:
+            del items[:expired]
 
         entry_id = int(now * 1000)
         items.append(
@@ -661,7 +736,7 @@ class PersistenceMixin:
         )
 
         if len(items) > 1200:
-            items = items[-1200:]
+            del items[:-1200]
 
         news["items"] = items
         self._save_galactic_news(news)
@@ -679,6 +754,10 @@ class PersistenceMixin:
 
         now = float(time.time())
         since = now - (86400 * days)
+        # Never surface entries past retention, even if the append-time trim
+        # left one behind.
+        retention_days = int(getattr(self, "galactic_news_retention_days", days))
+        since = max(since, now - (86400 * retention_days))
         seen_after = float(getattr(self.player, "last_seen_news_timestamp", 0.0) or 0.0)
         player_name = str(self.player.name)
 
@@ -772,6 +851,7 @@ class PersistenceMixin:
         self.player.last_resource_interest_time = time.time()
         self.planet_heat = {}
         self.last_heat_decay_time = time.time()
+        self._next_heat_decay_at = None
         self.planet_events = {}
         self.market_momentum = {}
         self.market_trade_volume = {}
@@ -947,6 +1027,9 @@ class PersistenceMixin:
 
         if getattr(self, "store", None) is None:
             return False
+        # Each store write is one SQLite transaction (WAL, synchronous=NORMAL),
+        # so a crash leaves either the old row or the new one, never a torn
+        # save, and commits do not fsync individually.
         self.store.upsert_character_payload(
             account_safe,
             char_safe,
@@ -1076,7 +1159,15 @@ class PersistenceMixin:
             self.player.last_special_weapon_time = float(
                 p_data.get("last_special_weapon_time", 0.0)
             )
-            self.player.port_visits = p_data.get("port_visits", {})
+            # Visit counts are stored as ints so the warp and docking paths
+            # can compare and increment them without re-coercing.
+            port_visits = {}
+            for planet_name, count in dict(p_data.get("port_visits") or {}).items():
+                try:
+                    port_visits[planet_name] = int(count)
+                except (TypeError, ValueError):
+                    continue
+            self.player.port_visits = port_visits
             self.player.last_commander_stipend_time = float(
                 p_data.get("last_commander_stipend_time", time.time())
             )
@@ -1179,17 +1270,28 @@ class PersistenceMixin:
                 )
             self.current_planet = self.get_planet_by_id(current_planet_id) or self.planets[0]
 
-            self.active_trade_contract = data.get("active_trade_contract")
+            contract = data.get("active_trade_contract")
+            if contract:
+                # Saves from before arc contracts lack these fields.
+                contract = {
+                    "arc_total_steps": 1,
+                    "arc_step": 1,
+                    "route_type": "LEGAL",
+                    **contract,
+                }
+            self.active_trade_contract = contract
             self.current_port_spotlight = data.get("current_port_spotlight")
 
             heat_state = data.get("law_heat", {})
+            # planet_heat only ever holds ints in 1..100; clamp on the way in.
             self.planet_heat = {
-                str(self._planet_name_from_id_key(k) or k): int(v)
+                str(self._planet_name_from_id_key(k) or k): min(100, int(v))
                 for k, v in (heat_state.get("levels", {}) or {}).items()
                 if int(v) > 0
                 and (self._planet_name_from_id_key(k) is not None)
             }
             self.last_heat_decay_time = float(heat_state.get("last_decay", time.time()))
+            self._next_heat_decay_at = None
             self._update_law_heat_decay()
 
             self.planet_events = {
@@ -1224,7 +1326,7 @@ class PersistenceMixin:
             self.get_active_trade_contract()
             if not self.active_trade_contract:
                 self._generate_trade_contract(force=True)
-            if not self.get_current_port_spotlight_deal():
+            if not self._live_port_spotlight_deal():
                 self._set_port_spotlight_deal(self.current_planet)
 
             self.mark_state_dirty()
@@ -1260,6 +1362,31 @@ class PersistenceMixin:
                 refs.append(f"db://{account_name}/{character_name}")
         return refs
 
+    def _iter_commander_data(self):
+        """(save_ref, payload) for every readable commander save, in table order.
+
+        One read of the characters table with one parse per row, so a winner
+        board snapshot and its broadcast never load a save twice.
+        """
+        if getattr(self, "store", None) is None:
+            return []
+        output = []
+        for _rowid, account_name, character_name, _updated_at, raw in (
+            self.store.iter_character_payload_rows()
+        ):
+            account_name = str(account_name or "").strip()
+            character_name = str(character_name or "").strip()
+            if not account_name or not character_name:
+                continue
+            try:
+                data = json.loads(raw)
+            except Exception:
+                continue
+            if not isinstance(data, dict):
+                continue
+            output.append((f"db://{account_name}/{character_name}", data))
+        return output
+
     def _find_commander_save_path_by_name(self, recipient_name):
         target = str(recipient_name or "").strip().lower()
         if not target:
@@ -136,37 +136,27 @@ class ShipOpsMixin:
         return int(max(1, tier))
 
     def get_docking_fee(self, planet=None, ship=None):
-        base_fee = float(self.config.get("base_docking_fee"))
-        level_multiplier = float(
-            self.config.get("docking_fee_ship_level_multiplier")
-        )
+        cfg = self._economy_cfg()
+        base_fee = cfg.docking_base_fee
+        level_multiplier = cfg.docking_level_multiplier
+        # Every other factor is positive, so a free-docking config can skip
+        # the reputation, standing and planet-event lookups.
+        if base_fee * level_multiplier <= 0:
+            return 0
         ship_level = self.get_ship_level(ship)
         rep = self._get_sector_reputation()
-        rep_step = float(self.config.get("reputation_docking_fee_step"))
         rep_tiers = int(rep // 20)
-        rep_modifier = 1.0 - (rep_tiers * rep_step)
+        rep_modifier = 1.0 - (rep_tiers * cfg.docking_reputation_step)
         rep_modifier = max(0.70, min(1.40, rep_modifier))
 
         authority = int(self._get_authority_standing())
         if authority < 0:
-            neg_step = max(
-                0.0,
-                float(self.config.get("authority_negative_docking_step", 0.010)),
-            )
-            neg_cap = max(
-                0.0,
-                float(self.config.get("authority_negative_docking_cap", 0.35)),
-            )
+            neg_step = cfg.docking_authority_negative_step
+            neg_cap = cfg.docking_authority_negative_cap
             rep_modifier *= 1.0 + min(neg_cap, abs(authority) * neg_step)
         elif authority > 0:
-            pos_step = max(
-                0.0,
-                float(self.config.get("authority_positive_docking_discount_step", 0.004)),
-            )
-            pos_cap = max(
-                0.0,
-                float(self.config.get("authority_positive_docking_discount_cap", 0.20)),
-            )
+            pos_step = cfg.docking_authority_positive_step
+            pos_cap = cfg.docking_authority_positive_cap
             rep_modifier *= max(0.60, 1.0 - min(pos_cap, authority * pos_step))
 
         event_modifier = 1.0
@@ -613,7 +613,8 @@ class GameServer:
     def _serialize_planet(self, planet):
         if planet is None:
             return {}
-        smuggling_inventory = dict(getattr(planet, "smuggling_inventory", {}) or {})
+        # Read-only walk: each entry is copied below, so no need to copy the dict.
+        smuggling_inventory = getattr(planet, "smuggling_inventory", None) or {}
         smuggling_payload = {}
         for item_name, data in smuggling_inventory.items():
             entry = dict(data or {}) if isinstance(data, dict) else {}
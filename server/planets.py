@@ -3,6 +3,7 @@ import os
 import math
 import logging
 import re
+import sys
 from sqlite_store import read_default_catalog_text
 
 
@@ -35,7 +36,7 @@ def load_base_prices():
                 if len(parts) < 2:
                     continue
 
-                item = parts[0].strip()
+                item = sys.intern(parts[0].strip())
                 if not item:
                     continue
 
@@ -281,7 +282,8 @@ class Planet:
         y=0,
     ):
         self.planet_id = int(planet_id)
-        self.name = name
+        # Interned so name compares and dict probes hit the identity fast path.
+        self.name = sys.intern(name) if isinstance(name, str) else name
         self.population = population
         self.description = description
         self.vendor = vendor
@@ -343,6 +345,35 @@ class Planet:
             prices[item] = int(round(base * (mod / 100)))
         return prices
 
+    def contraband_alert_template(self):
+        """Scan-alert message with vendor and security tier pre-filled.
+
+        Leaves {tier}, {item} and {heat} for str.format; rebuilt only if the
+        vendor or security level changes.
+        """
+        key = (self.security_level == 2, self.vendor)
+        cached = getattr(self, "_contraband_alert_fmt", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        vendor = str(self.vendor).replace("{", "{{").replace("}", "}}")
+        if key[0]:
+            fmt = (
+                f"SECURITY ALERT! {vendor} SCANNERS DETECTED {{tier}} CONTRABAND "
+                "({item}). HEAT {heat}%! PREPARE TO BE BOARDED!"
+            )
+        else:
+            fmt = (
+                f"SECURITY WARNING: {vendor} flagged your vessel for contraband "
+                "signatures ({item}). HEAT {heat}%."
+            )
+        self._contraband_alert_fmt = (key, fmt)
+        return fmt
+
+    def market_item_names(self):
+        """Live view of the legal market's item names, without building prices."""
+        return self.item_modifiers.keys()
+
     def get_smuggling_price(self, item_name):
         """Calculates absolute price for a smuggling item."""
         if item_name in self.smuggling_inventory:
@@ -363,31 +394,35 @@ class Planet:
 
     def fluctuate_prices(self):
         """Randomly fluctuate item price modifiers. Standard +/- 15%, Smuggling +/- 40%."""
-        import random
-
+        modifiers = self.item_modifiers
         if self.name == "Urth":
-            for item in [k for k in base_prices.keys() if k]:
-                self.item_modifiers[item] = 100
+            for item in base_prices:
+                if item:
+                    modifiers[item] = 100
             return
 
+        # One sector rotation walks every planet, so the RNG methods are bound
+        # once and the clamps are plain compares. Draw order is unchanged.
+        uniform = random.uniform
+
         # Standard items: controlled drift to preserve identity while still rotating deals.
-        for item in self.item_modifiers:
-            variance = random.uniform(0.90, 1.12)
-            self.item_modifiers[item] = max(
-                60, min(185, int(self.item_modifiers[item] * variance))
-            )
+        for item, modifier in modifiers.items():
+            value = int(modifier * uniform(0.90, 1.12))
+            modifiers[item] = 60 if value < 60 else (185 if value > 185 else value)
 
         # Smuggling items
+        roll = random.random
         for item, data in self.smuggling_inventory.items():
-            variance = random.uniform(0.72, 1.32)
+            variance = uniform(0.72, 1.32)
             if "modifier" not in data:
                 # Initialize modifier if it was absolute price before
                 base = base_prices.get(item, 1000)
                 data["modifier"] = int((data.get("price", 1000) / base) * 100)
 
-            data["modifier"] = max(90, min(520, int(data["modifier"] * variance)))
+            value = int(data["modifier"] * variance)
+            data["modifier"] = 90 if value < 90 else (520 if value > 520 else value)
             # Occasionally restock a small amount (5% chance)
-            if random.random() < 0.05:
+            if roll() < 0.05:
                 data["quantity"] += random.randint(1, 2)
 
     def get_info(self):
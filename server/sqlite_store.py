@@ -2,6 +2,7 @@ import json
 import sqlite3
 import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -44,7 +45,7 @@ def _safe_json_loads(raw_value, default_value):
 class SQLiteStore:
     """Single SQLite authority for runtime/server data."""
 
-    SCHEMA_VERSION = 2
+    SCHEMA_VERSION = 3
     DEFAULT_SETTINGS = {
         "server_port": 8765,
         "planet_price_penalty_multiplier": 1.0,
@@ -109,6 +110,7 @@ class SQLiteStore:
                     display_name TEXT,
                     payload_json TEXT NOT NULL,
                     updated_at REAL NOT NULL,
+                    version INTEGER NOT NULL DEFAULT 0,
                     PRIMARY KEY (account_name, character_name),
                     FOREIGN KEY (account_name) REFERENCES accounts(account_name) ON DELETE CASCADE
                 );
@@ -206,6 +208,14 @@ class SQLiteStore:
                 CREATE INDEX IF NOT EXISTS idx_combat_sessions_combat_id ON combat_sessions(combat_id);
                 """
                 )
+                character_columns = {
+                    row["name"]
+                    for row in self.conn.execute("PRAGMA table_info(characters)")
+                }
+                if "version" not in character_columns:
+                    self.conn.execute(
+                        "ALTER TABLE characters ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+                    )
                 self.conn.execute(
                     "INSERT OR IGNORE INTO schema_migrations(version, applied_at) VALUES (?, ?)",
                     (self.SCHEMA_VERSION, float(time.time())),
@@ -807,6 +817,9 @@ class SQLiteStore:
             pass
 
     def set_kv(self, namespace, key, payload):
+        # Shared state (universe planets, news, winner board) is rewritten
+        # often; encode compactly and outside the write lock.
+        value_json = json.dumps(payload, ensure_ascii=True, separators=(",", ":"))
         with self._write_lock:
             with self.conn:
                 self.conn.execute(
@@ -820,7 +833,7 @@ class SQLiteStore:
                 (
                     str(namespace),
                     str(key),
-                    json.dumps(payload, ensure_ascii=True),
+                    value_json,
                     float(time.time()),
                 ),
                 )
@@ -837,6 +850,15 @@ class SQLiteStore:
         except Exception:
             return default
 
+    def get_kv_raw(self, namespace, key):
+        """Stored JSON text for a key (None if absent), for callers that cache
+        their own parsed copy and only re-parse when the text changes."""
+        row = self.conn.execute(
+            "SELECT value_json FROM kv_store WHERE namespace=? AND key=?",
+            (str(namespace), str(key)),
+        ).fetchone()
+        return row["value_json"] if row else None
+
     def delete_kv(self, namespace, key):
         with self._write_lock:
             with self.conn:
@@ -1005,6 +1027,9 @@ class SQLiteStore:
 
         data = dict(payload or {})
         name = str(display_name or data.get("player", {}).get("name") or character)
+        # Character saves are machine-only; compact separators keep the rows
+        # small and the encode happens before the write lock is taken.
+        payload_json = json.dumps(data, ensure_ascii=True, separators=(",", ":"))
         with self._write_lock:
             with self.conn:
                 self.conn.execute(
@@ -1014,13 +1039,14 @@ class SQLiteStore:
                 ON CONFLICT(account_name, character_name) DO UPDATE SET
                     display_name=excluded.display_name,
                     payload_json=excluded.payload_json,
-                    updated_at=excluded.updated_at
+                    updated_at=excluded.updated_at,
+                    version=characters.version + 1
                 """,
                 (
                     account,
                     character,
                     name,
-                    json.dumps(data, ensure_ascii=True),
+                    payload_json,
                     float(time.time()),
                 ),
                 )
@@ -1045,6 +1071,49 @@ class SQLiteStore:
         except Exception:
             return None
 
+    @contextmanager
+    def edit_character_payload(self, account_name, character_name):
+        """Yield one character payload for in-place edits in a single transaction.
+
+        Yields None when the row is missing or unreadable. On a clean exit the
+        dict is written back (only if it changed); an exception rolls back.
+        """
+        account = str(account_name or "").strip().lower().replace(" ", "_")
+        character = str(character_name or "").strip().lower().replace(" ", "_")
+        if not account or not character:
+            yield None
+            return
+
+        with self._write_lock:
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                row = self.conn.execute(
+                    """
+                    SELECT payload_json FROM characters
+                    WHERE account_name=? AND character_name=?
+                    """,
+                    (account, character),
+                ).fetchone()
+                data = None
+                if row:
+                    try:
+                        data = json.loads(row["payload_json"])
+                    except Exception:
+                        data = None
+                yield data
+                if not isinstance(data, dict):
+                    return
+                payload_json = json.dumps(data, ensure_ascii=True, separators=(",", ":"))
+                if payload_json == row["payload_json"]:
+                    return
+                self.conn.execute(
+                    """
+                    UPDATE characters SET payload_json=?, updated_at=?, version=version + 1
+                    WHERE account_name=? AND character_name=?
+                    """,
+                    (payload_json, float(time.time()), account, character),
+                )
+
     def find_character_payload_by_name(self, character_name):
         character = str(character_name or "").strip().lower().replace(" ", "_")
         if not character:
@@ -1151,6 +1220,43 @@ class SQLiteStore:
             )
         return output
 
+    def iter_character_payload_rows(self):
+        """Unparsed (rowid, account, character, updated_at, payload_json) tuples,
+        so a full walk of the saves reads the table once and parses each row
+        exactly once."""
+        return self.conn.execute(
+            "SELECT rowid, account_name, character_name, updated_at, payload_json"
+            " FROM characters"
+        ).fetchall()
+
+    def iter_character_payload_stamps(self):
+        """(rowid, account, character, updated_at, version) per row.
+
+        The change stamp for callers that cache parsed payloads: every write
+        bumps version, and updated_at tells a re-created row from the deleted
+        one whose rowid it reused. Fetch the text of moved rows in one go with
+        get_character_payloads_json().
+        """
+        return self.conn.execute(
+            "SELECT rowid, account_name, character_name, updated_at, version"
+            " FROM characters"
+        ).fetchall()
+
+    def get_character_payloads_json(self, rowids):
+        """{rowid: payload_json} for the given rowids; missing rows are absent."""
+        rowids = [int(rowid) for rowid in rowids]
+        found = {}
+        # Chunked to stay under SQLite's bound-parameter limit.
+        for start in range(0, len(rowids), 500):
+            chunk = rowids[start : start + 500]
+            marks = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT rowid, payload_json FROM characters WHERE rowid IN ({marks})",
+                chunk,
+            ):
+                found[row[0]] = row[1]
+        return found
+
     def iter_character_summaries(self, active_only=False):
         where = ""
         if active_only:
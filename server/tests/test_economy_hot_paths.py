@@ -0,0 +1,317 @@
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+
+SERVER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
+
+from sqlite_store import SQLiteStore
+from classes import Player, load_spaceships
+from planets import generate_planets
+from game_manager_modules import GameManager
+
+
+def _build_trade_gm(tmp_dir):
+    """GameManager wired to a copy of the default DB without touching saves/."""
+    db_copy = os.path.join(tmp_dir, "game_state.db")
+    shutil.copyfile(os.path.join(SERVER_DIR, "saves", "game_state.db"), db_copy)
+
+    gm = GameManager.__new__(GameManager)
+    gm.store = SQLiteStore(db_copy)
+    gm.load_global_config()
+    gm.store.close()
+    gm.store = None
+    gm.config["economy_event_chance"] = 0.0
+
+    gm.planets = generate_planets()
+    gm._rebuild_planet_registry()
+    gm.spaceships = load_spaceships()
+    gm.item_aliases = {"Fuel Cell": "Fuel Cells"}
+    gm.planet_price_penalty_duration = 86400
+    gm.planet_price_penalty_multiplier = float(
+        gm.config["planet_price_penalty_multiplier"]
+    )
+    gm.player = Player("Tester", gm.spaceships[0].clone(), credits=500000)
+    gm.current_planet = gm.planets[0]
+    gm.active_trade_contract = None
+    gm.current_port_spotlight = None
+    gm.planet_heat = {}
+    gm.last_heat_decay_time = time.time()
+    gm.planet_events = {}
+    gm.market_momentum = {}
+    gm.market_trade_volume = {}
+    gm.last_market_update_time = time.time()
+    gm.last_market_rotation_time = time.time()
+    gm.bribed_planets = set()
+    gm.bribe_registry = {}
+    gm._smuggling_item_cache = None
+    gm._smuggling_item_set = None
+    gm._smuggling_item_meta_cache = {}
+    gm._contraband_profile_cache = {}
+    gm._request_scope = None
+    return gm
+
+
+class EconomyHotPathTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(1234)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.gm = _build_trade_gm(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_market_multiplier_tracks_trade_impact(self):
+        gm = self.gm
+        planet = gm.current_planet
+        item_name = next(iter(planet.items))
+
+        self.assertEqual(gm._get_market_price_multiplier(planet.name, item_name, "BUY"), 1.0)
+        gm._apply_market_trade_impact(planet.name, item_name, "BUY", 9)
+
+        momentum = gm._get_market_momentum_value(planet.name, item_name)
+        self.assertGreater(momentum, 0.0)
+        self.assertEqual(momentum, gm._momentum_raw(planet.name, item_name))
+        self.assertAlmostEqual(gm._get_market_volume_value(planet.name, item_name), 9.0, places=3)
+        self.assertGreater(
+            gm._get_market_price_multiplier(planet.name, item_name, "BUY"), 1.0
+        )
+        self.assertLess(
+            gm._get_market_price_multiplier(planet.name, item_name, "SELL"), 1.05
+        )
+
+    def test_request_scope_memoizes_heat_until_adjusted(self):
+        gm = self.gm
+        planet = gm.current_planet
+        gm.planet_heat[planet.name] = 10
+
+        with gm._economy_request() as scope:
+            self.assertEqual(gm._get_law_heat(planet.name), 10)
+            gm.planet_heat[planet.name] = 40
+            self.assertEqual(gm._get_law_heat(planet.name), 10)
+            self.assertEqual(gm._adjust_law_heat(planet.name, 5), 45)
+            self.assertEqual(gm._get_law_heat(planet.name), 45)
+            with gm._economy_request() as inner:
+                self.assertIs(inner, scope)
+        self.assertIsNone(gm._request_scope)
+        self.assertEqual(gm._get_law_heat(planet.name), 45)
+
+    def test_law_heat_decay_sweeps_once_per_hour(self):
+        gm = self.gm
+        self.assertEqual(gm.cfg.law_heat_decay_per_hour, 3)
+        gm.planet_heat = {"Novos": 40, "Arcaniska": 5}
+        gm.last_heat_decay_time = time.time() - 7300
+
+        gm._update_law_heat_decay()
+        self.assertEqual(gm.planet_heat, {"Novos": 34})
+
+        # Within the hour the deadline gate skips the sweep entirely.
+        gm.last_heat_decay_time = 0.0
+        gm._update_law_heat_decay()
+        self.assertEqual(gm.planet_heat, {"Novos": 34})
+
+    def test_contraband_detection_uses_supplied_roll(self):
+        gm = self.gm
+        gm.current_planet = next(p for p in gm.planets if p.security_level > 0)
+        item_name = gm.get_smuggling_item_names()[0]
+        gm.player.inventory[item_name] = 3
+
+        self.assertEqual(gm.check_contraband_detection(roll=0.999999), (False, ""))
+        self.assertEqual(gm._get_law_heat(gm.current_planet.name), 0)
+
+        detected, msg = gm.check_contraband_detection(roll=0.0)
+        self.assertTrue(detected)
+        self.assertIn(item_name.upper(), msg)
+        self.assertGreater(gm._get_law_heat(gm.current_planet.name), 0)
+
+    def test_item_index_follows_market_rotation(self):
+        gm = self.gm
+        index = gm._get_item_index()
+        item_name = next(iter(gm.current_planet.items))
+        self.assertIn(
+            (gm.current_planet, gm.current_planet.items[item_name]), index[item_name]
+        )
+
+        gm.last_market_rotation_time = 0.0
+        gm._apply_market_rotation_if_due()
+        rebuilt = gm._get_item_index()
+        self.assertIsNot(rebuilt, index)
+        for planet, base_price in rebuilt[item_name]:
+            self.assertEqual(planet.items[item_name], base_price)
+
+    def test_quick_sell_matches_per_item_trade_loop(self):
+        def stock(gm):
+            # A patrolled port with no contraband desk: salvage and contraband
+            # both reach the broker, and scans draw from the seeded RNG.
+            planet = gm.current_planet = gm.get_planet_by_name("Mastodrun")
+            market = planet.market_item_names()
+            salvage = sorted(
+                {
+                    name
+                    for other in gm.planets
+                    for name in other.items
+                    if name not in market
+                }
+                - gm._smuggling_item_name_set()
+            )[:2]
+            contraband = [
+                name
+                for name in gm.get_smuggling_item_names()
+                if name not in market and name not in planet.smuggling_inventory
+            ][:1]
+            for qty, name in enumerate(salvage + contraband, start=2):
+                gm.player.inventory[name] = qty
+            gm.active_trade_contract = {
+                "item": salvage[0],
+                "destination_planet": planet.name,
+                "quantity": 50,
+                "delivered": 0,
+                "reward": 1000,
+                "expires_at": time.time() + 3600,
+            }
+            return salvage, contraband
+
+        salvage, contraband = stock(self.gm)
+        self.assertEqual((len(salvage), len(contraband)), (2, 1))
+        cargo = list(self.gm.player.inventory.items())
+
+        random.seed(99)
+        ok, _msg = self.gm.sell_non_market_cargo()
+        self.assertTrue(ok)
+
+        random.seed(1234)
+        reference = _build_trade_gm(self._tmp.name)
+        stock(reference)
+        random.seed(99)
+        for item_name, qty in cargo:
+            reference.trade_item(item_name, "SELL", qty)
+
+        for gm in (self.gm, reference):
+            self.assertEqual(gm.player.inventory, {})
+        self.assertEqual(self.gm.player.credits, reference.player.credits)
+        self.assertEqual(
+            self.gm.player.smuggling_runs, reference.player.smuggling_runs
+        )
+        self.assertEqual(
+            self.gm.player.smuggling_units_moved,
+            reference.player.smuggling_units_moved,
+        )
+        self.assertEqual(self.gm.active_trade_contract["delivered"], 2)
+        self.assertEqual(
+            self.gm.active_trade_contract["delivered"],
+            reference.active_trade_contract["delivered"],
+        )
+
+    def test_active_contract_view_leaves_stored_contract_clean(self):
+        gm = self.gm
+        gm.config["enable_trade_contracts"] = True
+        gm._generate_trade_contract(force=True)
+        view = gm.get_active_trade_contract()
+        self.assertEqual(view["remaining_qty"], view["quantity"])
+        self.assertNotIn("remaining_qty", gm.active_trade_contract)
+        self.assertNotIn("remaining_seconds", gm.active_trade_contract)
+
+        gm.current_planet = gm.get_planet_by_name(view["destination_planet"])
+        gm._apply_trade_contract_progress(view["item"], 1)
+        self.assertEqual(gm.active_trade_contract["delivered"], 1)
+        self.assertEqual(
+            gm.get_active_trade_contract()["remaining_qty"], view["quantity"] - 1
+        )
+        saved = gm._build_save_payload()["active_trade_contract"]
+        self.assertNotIn("remaining_qty", saved)
+
+    def test_news_trim_drops_expired_prefix_and_read_filters_stragglers(self):
+        gm = self.gm
+        gm.store = SQLiteStore(os.path.join(self._tmp.name, "game_state.db"))
+        self.addCleanup(gm.store.close)
+        gm.galactic_news_retention_days = 3
+        gm.config["galactic_news_window_days"] = 7
+        now = time.time()
+        old = now - 5 * 86400
+
+        def item(title, ts):
+            return {"title": title, "timestamp": ts, "audience": "global"}
+
+        # An expired entry stranded behind a newer one, as a clock step
+        # between servers would leave it.
+        gm._save_galactic_news(
+            {
+                "items": [
+                    item("old-1", old),
+                    item("old-2", old + 60),
+                    item("fresh", now - 3600),
+                    item("straggler", old + 120),
+                ]
+            }
+        )
+        gm._append_galactic_news("latest", "body")
+
+        stored = [e["title"] for e in gm._load_galactic_news()["items"]]
+        self.assertEqual(stored, ["fresh", "straggler", "latest"])
+        unseen = [e["title"] for e in gm.get_unseen_galactic_news()]
+        self.assertEqual(unseen, ["latest", "fresh"])
+
+    def test_orbit_scan_filters_cached_commander_rows(self):
+        gm = self.gm
+        gm.store = SQLiteStore(os.path.join(self._tmp.name, "game_state.db"))
+        self.addCleanup(gm.store.close)
+        gm.npc_ships = []
+        here = gm.current_planet
+        gm.store.upsert_character_payload(
+            "a", "ghost", {"current_planet_id": here.planet_id, "player": {"name": "Ghost"}}
+        )
+        gm.store.upsert_character_payload(
+            "b",
+            "locked",
+            {
+                "current_planet_id": here.planet_id,
+                "password_hash": "$2b$hash",
+                "player": {"name": "Locked"},
+            },
+        )
+        gm.store.upsert_character_payload(
+            "c", "legacy", {"current_planet_name": here.name, "player": {"name": "Legacy"}}
+        )
+
+        names = sorted(t["name"] for t in gm.get_orbit_targets())
+        self.assertEqual(names, ["Ghost", "Legacy"])
+        self.assertEqual(gm._cached_orbit_targets["Ghost"]["save_path"], "db://a/ghost")
+
+        # Writes from any path are visible on the next scan.
+        gm.store.upsert_character_payload(
+            "a",
+            "ghost",
+            {"current_planet_id": here.planet_id, "player": {"name": "Ghost", "credits": 0}},
+        )
+        gm.get_orbit_targets()
+        self.assertEqual(gm._cached_orbit_targets["Ghost"]["raw_data"]["player"]["credits"], 0)
+
+        # A same-length rewrite within one clock tick still bumps the version.
+        frozen = {"current_planet_id": here.planet_id, "player": {"name": "Ghoul"}}
+        with mock.patch("time.time", return_value=1700000000.0):
+            gm.store.upsert_character_payload("c", "legacy", frozen)
+            gm.get_orbit_targets()
+            frozen["player"]["name"] = "Ghast"
+            gm.store.upsert_character_payload("c", "legacy", frozen)
+            names = sorted(t["name"] for t in gm.get_orbit_targets())
+        self.assertEqual(names, ["Ghast", "Ghost"])
+
+        gm.player.inventory["Titanium"] = 2
+        ok, _ = gm.gift_cargo_to_orbit_target(
+            gm._cached_orbit_targets["Ghost"], "Titanium", 2
+        )
+        self.assertTrue(ok)
+        gm.get_orbit_targets()
+        ghost = gm._cached_orbit_targets["Ghost"]["raw_data"]["player"]
+        self.assertEqual(ghost["inventory"], {"Titanium": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
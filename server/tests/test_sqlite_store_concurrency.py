@@ -40,6 +40,27 @@ class SQLiteStoreConcurrencyTests(unittest.TestCase):
         actual = self.store.get_player_resource_amount(1, "credits")
         self.assertEqual(actual, expected)
 
+    def test_edit_character_payload_is_atomic_under_threads(self):
+        self.store.upsert_character_payload(
+            "acct", "pilot", {"player": {"name": "Pilot", "inventory": {}}}
+        )
+        per_worker = 50
+        worker_count = 8
+
+        def add_cargo(_):
+            for _i in range(per_worker):
+                with self.store.edit_character_payload("acct", "pilot") as data:
+                    inventory = data["player"]["inventory"]
+                    inventory["Titanium"] = inventory.get("Titanium", 0) + 1
+
+        with ThreadPoolExecutor(max_workers=worker_count) as pool:
+            list(pool.map(add_cargo, range(worker_count)))
+
+        payload = self.store.get_character_payload("acct", "pilot")
+        self.assertEqual(payload["player"]["inventory"]["Titanium"], per_worker * worker_count)
+        with self.store.edit_character_payload("acct", "missing") as data:
+            self.assertIsNone(data)
+
 
 if __name__ == "__main__":
     unittest.main()